@@ -13,15 +13,19 @@ SERIES_ID = "272472"  # Paw Patrol
 if not API_KEY:
     raise RuntimeError("Missing TVDB_API_KEY in .env file.")
 
+# Reuse one pooled, keep-alive connection for the login and every page
+# instead of a fresh TLS handshake per request.
+session = requests.Session()
+
 # Authenticate
 print("Authenticating with TheTVDB...")
 auth_url = "https://api.thetvdb.com/login"
 auth_payload = {"apikey": API_KEY}
-auth_resp = requests.post(auth_url, json=auth_payload)
+auth_resp = session.post(auth_url, json=auth_payload)
 auth_resp.raise_for_status()
 token = auth_resp.json()["token"]
 
-headers = {"Authorization": f"Bearer {token}"}
+session.headers.update({"Authorization": f"Bearer {token}"})
 
 # Fetch all episodes (paginated)
 episodes = []
@@ -29,7 +33,7 @@ page = 1
 print("Fetching episodes...")
 while True:
     url = f"https://api.thetvdb.com/series/{SERIES_ID}/episodes?page={page}"
-    resp = requests.get(url, headers=headers)
+    resp = session.get(url)
     resp.raise_for_status()
     data = resp.json()
     episodes.extend(data["data"])
@@ -0,0 +1,71 @@
+"""Compile NameGnome's scanner hot loop to a C extension with mypyc (opt-in).
+
+The directory walk in ``namegnome.core.scanner`` is a pure-Python loop of
+string, set and dict operations; mypyc compiles the fully annotated module
+as-is. The extension is built *in place* next to ``scanner.py`` so the normal
+import picks it up, and removing it (``--clean``) falls back to the pure-Python
+module. Requires ``mypy`` (already a project dependency) and a C compiler.
+
+Usage:
+    python scripts/build_mypyc.py          # build src/namegnome/core/scanner*.so
+    python scripts/build_mypyc.py --clean  # remove the compiled extension
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+# Reason: the CLI layer (namegnome/cli/commands.py) is deliberately not listed.
+# Typer introspects the command functions and the module resolves its heavy
+# imports lazily through a module __getattr__; the compiled module crashes on
+# import. Its option handling is a few attribute copies per invocation anyway.
+MYPYC_FILES = ["namegnome/core/scanner.py"]
+
+
+def clean() -> None:
+    """Remove compiled extension modules so the pure-Python sources are used."""
+    for rel in MYPYC_FILES:
+        module = SRC_DIR / rel
+        for ext in module.parent.glob(f"{module.stem}*.so"):
+            ext.unlink()
+            print(f"Removed {ext}")
+        for ext in module.parent.glob(f"{module.stem}*.pyd"):
+            ext.unlink()
+            print(f"Removed {ext}")
+    # Building more than one module also emits a shared runtime library at the
+    # top of the source tree.
+    for pattern in ("*__mypyc*.so", "*__mypyc*.pyd"):
+        for ext in SRC_DIR.glob(pattern):
+            ext.unlink()
+            print(f"Removed {ext}")
+
+
+def build() -> None:
+    """Compile MYPYC_FILES in place under src/."""
+    from mypyc.build import mypycify
+    from setuptools import setup
+
+    os.chdir(SRC_DIR)
+    # Keep generated C sources and object files out of the source tree.
+    with tempfile.TemporaryDirectory() as build_dir:
+        setup(
+            name="namegnome-mypyc",
+            ext_modules=mypycify(MYPYC_FILES, target_dir=build_dir),
+            script_args=[
+                "build_ext",
+                "--inplace",
+                "--build-temp",
+                build_dir,
+                "--build-lib",
+                build_dir,
+            ],
+        )
+
+
+if __name__ == "__main__":
+    if "--clean" in sys.argv[1:]:
+        clean()
+    else:
+        build()
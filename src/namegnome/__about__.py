@@ -4,3 +4,12 @@
 #
 # SPDX-License-Identifier: MIT
 __version__ = "0.0.1"
+
+
+def version_message() -> str:
+    """Return the Rich markup printed by ``namegnome version``.
+
+    Reason: shared by the Typer command and the Typer-free fast path in
+    ``__main__``, so this module must not import the CLI.
+    """
+    return f"NameGnome version: [bold]{__version__}[/bold]"
@@ -1,6 +1,27 @@
 """Main entry point for the namegnome CLI."""
 
-from namegnome.cli.commands import app
+import sys
+
+
+def _run() -> None:
+    """Dispatch to the Typer app, answering ``namegnome version`` directly.
+
+    Reason: the version command only prints one line, but routing it through the
+    app imports Typer, Click and the command modules (over 100 ms) first. Any
+    other argv, including global options such as --no-rich, uses the app.
+    """
+    if sys.argv[1:] == ["version"]:
+        from rich.console import Console
+
+        from namegnome.__about__ import version_message
+
+        Console().print(version_message())
+        return
+
+    from namegnome.cli.commands import main
+
+    main()
+
 
 if __name__ == "__main__":
-    app()
+    _run()
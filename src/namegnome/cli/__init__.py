@@ -5,26 +5,50 @@ user-facing output.
 
 - app: The Typer application object, used by all CLI entrypoints and subcommands.
 - console: Rich Console instance for consistent, styled output and logging.
-- All CLI modules import app and console from this package to use rich for output,
-  show pretty tracebacks, and provide a single CLI entrypoint for all commands.
+- All CLI modules import app and console from this package to use rich for output
+  and provide a single CLI entrypoint for all commands.
+- install_rich_traceback: Opt-in pretty tracebacks (NAMEGNOME_RICH_TRACEBACK=1),
+  installed by the CLI entrypoint rather than at import time.
 
 Follows CLI UX guidelines from PLANNING.md: always use rich for output, show
 pretty tracebacks, and provide a single CLI entrypoint for all commands.
 """
 
+import os
 from collections.abc import Callable
 from typing import Any, TypeVar
 
 import typer
-from rich.console import Console
-from rich.traceback import install
 
-# Install rich traceback handler for all CLI commands
-install(show_locals=True)
+from namegnome.cli import _state
 
 # Reason: Global console object ensures all output is styled and consistent across
-# commands (see PLANNING.md CLI UX guidelines).
-console = Console()
+# commands (see PLANNING.md CLI UX guidelines). It is the single instance defined
+# in namegnome.cli.console, so terminal detection runs once per process.
+from namegnome.cli.console import console
+
+# ENV VAR that opts in to Rich's pretty traceback handler for uncaught errors
+_ENV_RICH_TRACEBACK = "NAMEGNOME_RICH_TRACEBACK"
+_rich_traceback_installed = False
+
+
+def install_rich_traceback() -> None:
+    """Install Rich's traceback handler once, if NAMEGNOME_RICH_TRACEBACK is set.
+
+    Reason: installing it at import time registered a sys.excepthook and loaded
+    rich.traceback (and pygments) on every invocation, including --help.
+    """
+    global _rich_traceback_installed
+    if _rich_traceback_installed or not os.environ.get(_ENV_RICH_TRACEBACK):
+        return
+    from rich.traceback import install
+
+    # Reason: rendering locals repr()s every frame's variables, which for large
+    # scan results and plans dominates error output; opt in with NAMEGNOME_DEBUG.
+    show_locals = os.getenv("NAMEGNOME_DEBUG", "0") == "1"
+    install(show_locals=show_locals, max_frames=20, width=120)
+    _rich_traceback_installed = True
+
 
 # Reason: Importing app and console here allows all CLI modules and commands to avoid
 # re-instantiation and ensure global options work as expected.
@@ -34,6 +58,53 @@ app = typer.Typer(
     add_completion=True,
 )
 
+# The Click `CliRunner` (used heavily in our test-suite) falls back to
+# `cli.name` when constructing a default program name. Typer ≥0.15 exposes
+# only `app.info.name`, which breaks on Windows with Click ≥8.1.8 – the
+# runner raises `AttributeError: 'Typer' object has no attribute 'name'`.
+#
+# Add a compat shim so that tests (and any downstream tooling) work across
+# all OSes and Click/Typer versions without pinning older releases.
+if not hasattr(app, "name"):
+    app.name = "namegnome"  # type: ignore[attr-defined]
+
+
+# Similarly, Click's testing harness expects a `main` attribute. Provide one
+# that proxies to the underlying Click command generated by Typer.
+_click_command: Any = None
+_click_command_key: tuple[int, int] = (-1, -1)
+
+
+def _get_click_command() -> Any:  # noqa: ANN401
+    """Return the Click command generated from *app*, rebuilt only on change.
+
+    Reason: typer.main.get_command walks every command signature and builds
+    fresh Click parameters (~3 ms for this app); repeated invocations through
+    ``app.main`` (e.g. Click's CliRunner) reuse one build instead. The cache is
+    keyed on the number of registered commands and sub-apps, so commands
+    registered after the first build are still picked up.
+    """
+    global _click_command, _click_command_key
+    key = (len(app.registered_commands), len(app.registered_groups))
+    if _click_command is None or key != _click_command_key:
+        from typer.main import get_command
+
+        _click_command = get_command(app)
+        _click_command_key = key
+    return _click_command
+
+
+def _lazy_click_main(*args, **kwargs):
+    """Defer fetching the underlying Click command until first use."""
+    return _get_click_command().main(*args, **kwargs)
+
+
+# Bind as a method so `self` (the Typer app) is passed implicitly if Click
+# ever expects it. The signature of click.Command.main is
+# `(args=None, prog_name=None, complete_var=None, standalone_mode=True)`. We
+# keep that flexible.
+app.main = _lazy_click_main  # type: ignore[attr-defined]
+
 F = TypeVar("F", bound=Callable[..., Any])
 
 
@@ -52,26 +123,29 @@ def callback(
     """Top-level CLI callback adding global options.
 
     The *--no-rich* flag allows users to disable Rich output entirely. We
-    implement it by setting the ``NAMEGNOME_NO_RICH`` environment variable so
-    that downstream utilities (e.g. :pyclass:`~namegnome.cli.console.ConsoleManager`)
-    can respond uniformly whether the flag is passed or the variable is set
-    externally.
+    implement it by setting :data:`namegnome.cli._state.NO_RICH`, which
+    downstream utilities (e.g. :pyclass:`~namegnome.cli.console.ConsoleManager`)
+    check alongside the ``NAMEGNOME_NO_RICH`` environment variable, so they
+    respond uniformly whether the flag is passed or the variable is set
+    externally. The ``ui.no_rich`` config setting is honoured as well.
     """
+    # Defer import to avoid cycles.
+    from namegnome.utils.config import resolve_setting
 
-    if no_rich:
-        # Defer import to avoid cycles.
-        import os
+    # Determine final value respecting env/config precedence.
+    final_no_rich = resolve_setting(
+        "ui.no_rich",
+        default=False,
+        cli_value=no_rich if no_rich else None,
+    )
 
-        os.environ["NAMEGNOME_NO_RICH"] = "1"
+    if final_no_rich:
+        _state.NO_RICH = True
 
 
 @app.command()
 def version() -> None:
     """Show the version of namegnome."""
-    from namegnome.__about__ import __version__
-
-    console.print(f"NameGnome version: [bold]{__version__}[/bold]")
-
+    from namegnome.__about__ import version_message
 
-if __name__ == "__main__":
-    app()
+    console.print(version_message())
@@ -0,0 +1,209 @@
+"""Shared Typer parameter annotations for the namegnome CLI commands.
+
+Each alias is an ``Annotated`` type carrying its ``typer.Argument`` or
+``typer.Option`` metadata, built once when this module is imported and reused
+by every command signature that takes the parameter.
+"""
+
+from pathlib import Path
+from typing import Annotated, Optional
+
+import typer
+
+# Root path parameter
+ROOT_PATH = Annotated[
+    Path,
+    typer.Argument(
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+        readable=True,
+        resolve_path=True,
+        help="Root directory to scan for media files",
+    ),
+]
+
+# Media type option
+MEDIA_TYPE = Annotated[
+    list[str],
+    typer.Option(
+        "--media-type",
+        "-t",
+        case_sensitive=False,
+        help="Media types to scan for (tv, movie, music). "
+        "At least one type must be specified.",
+    ),
+]
+
+# Platform option
+PLATFORM = Annotated[
+    str,
+    typer.Option(
+        "--platform",
+        "-p",
+        case_sensitive=False,
+        help="Target platform (e.g., plex, jellyfin, emby)",
+    ),
+]
+
+# Other options with annotations
+SHOW_NAME = Annotated[
+    Optional[str],
+    typer.Option(
+        "--show-name",
+        help="Explicit show name for TV files",
+    ),
+]
+
+MOVIE_YEAR = Annotated[
+    Optional[int],
+    typer.Option(
+        "--movie-year",
+        help="Explicit year for movie files",
+    ),
+]
+
+ANTHOLOGY = Annotated[
+    bool,
+    typer.Option(
+        "--anthology",
+        help="Whether the TV show is an anthology series",
+    ),
+]
+
+ADJUST_EPISODES = Annotated[
+    bool,
+    typer.Option(
+        "--adjust-episodes",
+        help="Adjust episode numbering for incorrectly numbered files",
+    ),
+]
+
+VERIFY = Annotated[
+    bool,
+    typer.Option(
+        "--verify",
+        help="Verify file integrity with checksums",
+    ),
+]
+
+JSON_OUTPUT = Annotated[
+    bool,
+    typer.Option(
+        "--json",
+        help="Output results in JSON format",
+    ),
+]
+
+LLM_MODEL = Annotated[
+    Optional[str],
+    typer.Option(
+        "--llm-model",
+        help="LLM model to use for fuzzy matching",
+    ),
+]
+
+NO_COLOR = Annotated[
+    bool,
+    typer.Option(
+        "--no-color",
+        help="Disable colored output",
+    ),
+]
+
+STRICT_DIRECTORY_STRUCTURE = Annotated[
+    bool,
+    typer.Option(
+        "--strict-directory-structure",
+        help="Enforce platform directory structure",
+    ),
+]
+
+UNTRUSTED_TITLES = Annotated[
+    bool,
+    typer.Option(
+        "--untrusted-titles",
+        help="Ignore input titles and rely solely on canonical metadata",
+    ),
+]
+
+MAX_DURATION = Annotated[
+    Optional[int],
+    typer.Option(
+        "--max-duration",
+        help="Max duration (minutes) to pair episodes in anthology mode",
+    ),
+]
+
+UNDO_PLAN_PATH = Annotated[
+    Path,
+    typer.Argument(
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+        readable=True,
+        resolve_path=True,
+        help="Path to the plan JSON file to undo",
+    ),
+]
+
+YES = Annotated[
+    bool,
+    typer.Option(
+        "--yes",
+        help="Skip confirmation prompt and undo immediately.",
+    ),
+]
+
+ARTWORK = Annotated[
+    bool,
+    typer.Option(
+        "--artwork",
+        help=(
+            "Download and cache high-quality artwork (poster) for each movie "
+            "using Fanart.tv"
+        ),
+    ),
+]
+
+NO_CACHE = Annotated[
+    bool,
+    typer.Option(
+        "--no-cache",
+        help=(
+            "Bypass all metadata caching (forces fresh API calls; "
+            "disables offline cache)"
+        ),
+    ),
+]
+
+PREFETCH_DEPTH = Annotated[
+    Optional[int],
+    typer.Option(
+        "--prefetch-depth",
+        min=0,
+        help=(
+            "Number of file stat() calls to issue ahead of the scanner "
+            "(helps on slow network shares; 0 disables)"
+        ),
+    ),
+]
+
+# New output path option for Sprint 1.4 -------------------------------------
+OUTPUT_PATH = Annotated[
+    Optional[Path],
+    typer.Option(
+        "--output",
+        "-o",
+        exists=False,
+        file_okay=True,
+        dir_okay=False,
+        writable=True,
+        readable=False,
+        resolve_path=True,
+        help=(
+            "Write the generated plan to the given file path (only meaningful "
+            "when used together with --json)."
+        ),
+    ),
+]
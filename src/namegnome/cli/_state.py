@@ -0,0 +1,33 @@
+"""Process-wide CLI state set by global options.
+
+- NO_RICH: set by the ``--no-rich`` flag (or the ``ui.no_rich`` setting) in the
+  top-level CLI callback.
+
+Reason: the callback used to export ``NAMEGNOME_NO_RICH=1`` into ``os.environ``,
+which mutated process-wide environment state and leaked the setting into every
+child process (ffprobe, Ollama). A module flag keeps it in-process; the
+environment variable is still honoured when users set it themselves.
+"""
+
+import os
+from functools import lru_cache
+
+# ENV VAR users can export to disable rich output entirely
+ENV_NO_RICH = "NAMEGNOME_NO_RICH"
+
+NO_RICH: bool = False
+
+
+@lru_cache(maxsize=1)
+def _env_no_rich() -> bool:
+    """Return True when the NAMEGNOME_NO_RICH environment variable is truthy.
+
+    Reason: nothing in the process sets the variable any more, so it is read and
+    parsed once rather than on every ConsoleManager entry and scan.
+    """
+    return os.getenv(ENV_NO_RICH, "0").lower() in {"1", "true", "yes"}
+
+
+def rich_disabled() -> bool:
+    """Return True when Rich output was disabled by flag, config or env var."""
+    return NO_RICH or _env_no_rich()
@@ -2,11 +2,12 @@
 
 This module centralises Rich configuration for CLI commands:
 
-* Pretty traceback installation with show_locals enabled.
+* Pretty traceback installation (frame locals only with NAMEGNOME_DEBUG=1).
 * A ``ConsoleManager`` context manager yielding a pre-configured :class:`rich.console.Console`.
-* Opt-out via the ``--no-rich`` flag (sets env var ``NAMEGNOME_NO_RICH``) or
-  the environment variable being set externally.
-* Helper :class:`FilenameColumn`` for progress bars.
+* Opt-out via the ``--no-rich`` flag (sets ``namegnome.cli._state.NO_RICH``) or
+  the ``NAMEGNOME_NO_RICH`` environment variable being set externally.
+* Helper :class:`FilenameColumn`` for progress bars (lazily re-exported from
+  :mod:`namegnome.cli.progress`).
 
 It is intentionally lightweight so that it can be imported early by CLI
 entry-points without triggering heavy Rich initialisation when disabled.
@@ -14,35 +15,56 @@ entry-points without triggering heavy Rich initialisation when disabled.
 
 from __future__ import annotations
 
+import importlib
 import os
 from contextlib import AbstractContextManager, contextmanager
-from typing import Any, Dict, Generator
+from typing import TYPE_CHECKING, Any, Dict, Generator
 
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
-from rich.traceback import install as install_rich_traceback
 import rich
 
-from namegnome.cli.utils.ascii_art import (
-    print_gnome_status,
-)  # Late import to avoid heavy deps unless used
+from namegnome.cli import _state
+
+if TYPE_CHECKING:
+    from namegnome.cli.progress import FilenameColumn, create_default_progress
 
 __all__ = [
     "console",
+    "BufferedLog",
     "ConsoleManager",
     "FilenameColumn",
     "create_default_progress",
     "gnome_status",
 ]
 
-# ENV VAR used to disable rich output entirely (useful for piping or testing)
-_ENV_DISABLE_RICH = "NAMEGNOME_NO_RICH"
+# Reason: the progress helpers need rich.progress (and with it rich.live and
+# the spinners), which --help, version and most config commands never use, so
+# they live in namegnome.cli.progress and are re-exported on first access.
+_LAZY_EXPORTS: dict[str, str] = {
+    "FilenameColumn": "namegnome.cli.progress",
+    "create_default_progress": "namegnome.cli.progress",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a re-exported progress helper on first access (PEP 562)."""
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
 # Provide a *global* console instance for modules that still import
 # ``namegnome.cli.console.console`` directly. This maintains backward
 # compatibility while we migrate callers towards :class:`ConsoleManager`.
 console: Console = Console()
 
+# Set once ConsoleManager has installed Rich's traceback handler in this process.
+_traceback_installed = False
+
 
 class ConsoleManager(AbstractContextManager):
     """Context manager that yields a configured Rich :class:`Console`.
@@ -55,7 +77,8 @@ class ConsoleManager(AbstractContextManager):
         expose it because many tests rely on rich recording for snapshotting.
     force_use:
         When *True* / *False* this overrides autodetection and forces rich
-        enabled/disabled. When *None*, autodetect via ``NAMEGNOME_NO_RICH``.
+        enabled/disabled. When *None*, autodetect via ``--no-rich`` or
+        ``NAMEGNOME_NO_RICH``.
     console_kwargs:
         Additional keyword arguments forwarded verbatim to the Console.
     """
@@ -76,16 +99,12 @@ class ConsoleManager(AbstractContextManager):
     # Context-manager protocol
     # ---------------------------------------------------------------------
     def __enter__(self) -> Console:  # noqa: D401 – unconcerned about docstring tense
-        # Determine whether rich output is enabled. CLI flag sets env var so we
-        # only need to inspect environment.
+        # Determine whether rich output is enabled: the --no-rich flag sets
+        # _state.NO_RICH and the env var may be set externally.
         if self._force_use is not None:
             rich_enabled = self._force_use
         else:
-            rich_enabled = os.getenv(_ENV_DISABLE_RICH, "0").lower() not in {
-                "1",
-                "true",
-                "yes",
-            }
+            rich_enabled = not _state.rich_disabled()
 
         # colour_system=None disables colour. Let Rich pick sensible default if
         # enabled; otherwise explicitly set colour_system=None so that colour
@@ -103,7 +122,19 @@ class ConsoleManager(AbstractContextManager):
 
         # Install pretty traceback so that any exception raised inside the
         # context is printed using rich formatting automatically.
-        install_rich_traceback(show_locals=True, console=self.console)
+        # Reason: installing rewires sys.excepthook; doing it on every entry
+        # repeated that global side effect for each (nested) manager, so it is
+        # installed once per process, bound to the first manager's console.
+        global _traceback_installed
+        if not _traceback_installed:
+            from rich.traceback import install as install_rich_traceback
+
+            install_rich_traceback(
+                show_locals=os.getenv("NAMEGNOME_DEBUG", "0") == "1",
+                max_frames=20,
+                console=self.console,
+            )
+            _traceback_installed = True
 
         return self.console
 
@@ -123,41 +154,49 @@ class ConsoleManager(AbstractContextManager):
 
 
 # -------------------------------------------------------------------------
-# Progress utilities
+# Buffered logging
 # -------------------------------------------------------------------------
-class FilenameColumn(TextColumn):
-    """Render just the basename of the current filename field in task fields."""
+class BufferedLog(AbstractContextManager):
+    """Collect log lines and emit them through ``Console.log`` in batches.
 
-    def __init__(self) -> None:
-        super().__init__("{task.fields[filename]}")
+    Per-event callbacks (e.g. one line per restored file during undo) would
+    otherwise pay Rich's render and write overhead for every message. Lines
+    are flushed every *flush_every* messages and when the context exits, so
+    output is not lost if the wrapped operation raises.
+    """
 
+    def __init__(self, console: Console, *, flush_every: int = 50) -> None:
+        self._console = console
+        self._flush_every = flush_every
+        self._lines: list[str] = []
 
-def create_default_progress() -> Progress:  # noqa: D401
-    """Return a standardised :class:`~rich.progress.Progress` instance.
+    def write(self, msg: str) -> None:
+        """Buffer *msg*, flushing once the batch size is reached."""
+        self._lines.append(msg)
+        if len(self._lines) >= self._flush_every:
+            self.flush()
 
-    Columns:
-    1. Spinner emoji column
-    2. Task description
-    3. Percentage
-    4. Elapsed time
-    5. Current filename (custom column)
-    """
+    def flush(self) -> None:
+        """Emit all buffered lines with a single ``Console.log`` call."""
+        if self._lines:
+            self._console.log("\n".join(self._lines))
+            self._lines.clear()
+
+    def __enter__(self) -> BufferedLog:
+        return self
 
-    return Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        TextColumn("{task.percentage:>3.0f}%"),
-        TimeElapsedColumn(),
-        FilenameColumn(),
-        console=rich.get_console(),
-    )
+    def __exit__(self, exc_type, exc_val, exc_tb):  # type: ignore[override]
+        self.flush()
+        return False
 
 
 # ---------------------------------------------------------------------
 # Gnome status context manager
 # ---------------------------------------------------------------------
 @contextmanager
-def gnome_status(console: Console | None = None) -> Generator[Console, None, None]:  # noqa: D401
+def gnome_status(
+    console: Console | None = None,
+) -> Generator[Console, None, None]:  # noqa: D401
     """Yield the provided console while showing status-gnome panels.
 
     On *enter* prints the "working" gnome panel, signalling that NameGnome is
@@ -173,6 +212,9 @@ def gnome_status(console: Console | None = None) -> Generator[Console, None, Non
         back to the global :data:`namegnome.cli.console.console` object.
     """
 
+    # Late import: the ASCII art is only needed when a command shows status
+    from namegnome.cli.utils.ascii_art import print_gnome_status
+
     if console is None:
         console = rich.get_console()
 
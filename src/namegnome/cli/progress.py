@@ -0,0 +1,51 @@
+"""Progress bar helpers for CLI commands.
+
+* :class:`FilenameColumn` renders the file currently being processed.
+* :func:`create_default_progress` returns the standard progress bar used by
+  scan and undo.
+
+Re-exported lazily by :mod:`namegnome.cli.console`, so importing the console
+module does not load ``rich.progress``.
+"""
+
+from __future__ import annotations
+
+import rich
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+
+__all__ = ["FilenameColumn", "create_default_progress"]
+
+
+class FilenameColumn(TextColumn):
+    """Render just the basename of the current filename field in task fields."""
+
+    def __init__(self) -> None:
+        super().__init__("{task.fields[filename]}")
+
+
+def create_default_progress() -> Progress:  # noqa: D401
+    """Return a standardised :class:`~rich.progress.Progress` instance.
+
+    Columns:
+    1. Spinner emoji column
+    2. Task description
+    3. Percentage
+    4. Elapsed time
+    5. Current filename (custom column)
+    """
+
+    progress_console = rich.get_console()
+    # Reason: the default 10 Hz refresh wakes the render thread constantly
+    # during tight scan loops; 2 Hz still animates the spinner. The bar is
+    # cleared when done and disabled outright when nobody is watching.
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        TextColumn("{task.percentage:>3.0f}%"),
+        TimeElapsedColumn(),
+        FilenameColumn(),
+        console=progress_console,
+        refresh_per_second=2,
+        transient=True,
+        disable=not progress_console.is_terminal,
+    )
@@ -17,6 +17,18 @@ from rich.table import Table
 from namegnome.models.core import PlanStatus
 from namegnome.models.plan import RenamePlan
 
+# Reason: Status styles are chosen to match both user-facing color conventions
+# and test assertions (see test_renderer.py). Defined once at module scope
+# rather than rebuilt on every render_diff call.
+_STATUS_STYLES: dict[PlanStatus, str] = {
+    PlanStatus.PENDING: "yellow bold",  # \033[1;33m
+    PlanStatus.MOVED: "green bold",  # \033[1;32m
+    PlanStatus.SKIPPED: "cyan",
+    PlanStatus.CONFLICT: "red bold",
+    PlanStatus.FAILED: "red",
+    PlanStatus.MANUAL: "bright_red bold",  # Use bright red for manual
+}
+
 
 def render_diff(plan: RenamePlan, console: Console | None = None) -> None:
     """Render a rename plan as a rich diff table.
@@ -36,51 +48,50 @@ def render_diff(plan: RenamePlan, console: Console | None = None) -> None:
     table.add_column("Destination", style="green")
     table.add_column("Reason", style="yellow")
 
-    # Reason: Status styles are chosen to match both user-facing color conventions
-    # and test assertions (see test_renderer.py).
-    status_styles = {
-        PlanStatus.PENDING: "yellow bold",  # \033[1;33m
-        PlanStatus.MOVED: "green bold",  # \033[1;32m
-        PlanStatus.SKIPPED: "cyan",
-        PlanStatus.CONFLICT: "red bold",
-        PlanStatus.FAILED: "red",
-        PlanStatus.MANUAL: "bright_red bold",  # Use bright red for manual
-    }
-
+    # Reason: the summary counts are tallied while the rows are built, so the
+    # summary needs no further passes (or throwaway lists) over a large plan.
+    conflicts = manual = failed = 0
+    # Reason: bound methods as locals skip an attribute lookup per row.
+    get_style = _STATUS_STYLES.get
+    add_row = table.add_row
     for item in plan.items:
-        status_style = status_styles.get(item.status, "white")
-        # Show manual_reason if present for manual items
-        reason = (
-            item.manual_reason
-            if item.status == PlanStatus.MANUAL and item.manual_reason
-            else item.reason or ""
-        )
-        table.add_row(
-            item.status.value,
+        status = item.status
+        reason = item.reason or ""
+        if status == PlanStatus.MANUAL:
+            manual += 1
+            # Show manual_reason if present for manual items
+            if item.manual_reason:
+                reason = item.manual_reason
+        elif status == PlanStatus.CONFLICT:
+            conflicts += 1
+        elif status == PlanStatus.FAILED:
+            failed += 1
+        add_row(
+            status.value,
             str(item.source),
             str(item.destination),
             reason,
-            style=status_style,
+            style=get_style(status, "white"),
         )
 
-    console.print(table)
-
-    # Calculate counts for summary
     total = len(plan.items)
-    conflicts = len([item for item in plan.items if item.status == PlanStatus.CONFLICT])
-    manual = len([item for item in plan.items if item.status == PlanStatus.MANUAL])
-    failed = len([item for item in plan.items if item.status == PlanStatus.FAILED])
 
     # Print summary in the expected format for the tests
-    console.print(f"Total: {total} | Conflicts: {conflicts}")
+    summary = [console.render_str(f"Total: {total} | Conflicts: {conflicts}")]
 
     if manual > 0:
-        console.print(
-            f"Manual intervention required: {manual}", style="bright_red bold"
-        )
+        line = console.render_str(f"Manual intervention required: {manual}")
+        line.stylize_before("bright_red bold")
+        summary.append(line)
 
     if failed > 0:
-        console.print(f"Failed items: {failed}", style="red bold")
+        line = console.render_str(f"Failed items: {failed}")
+        line.stylize_before("red bold")
+        summary.append(line)
+
+    # Reason: one print renders and writes the table and summary together,
+    # instead of paying Rich's render/flush cycle once per line.
+    console.print(table, *summary, sep="\n")
 
 
 # TODO: NGN-204 - Add support for exporting diff tables to Markdown or HTML for
@@ -11,8 +11,31 @@ See scanner.py for implementation details and reasoning behind classification
 logic.
 """
 
-from namegnome.core.scanner import guess_media_type, scan_directory
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from namegnome.core.scanner import guess_media_type, scan_directory
 
 # Reason: Only expose the main scanning and classification API to consumers of
 # the core package.
 __all__ = ["guess_media_type", "scan_directory"]
+
+# Reason: importing any core submodule (planner, undo, episode_parser, ...)
+# initializes this package first; resolving the scanner re-exports lazily keeps
+# those imports from also loading the scanner and its model dependencies.
+_LAZY_EXPORTS: dict[str, str] = {
+    "guess_media_type": "namegnome.core.scanner",
+    "scan_directory": "namegnome.core.scanner",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a re-exported function on first access (PEP 562)."""
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
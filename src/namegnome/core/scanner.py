@@ -4,13 +4,17 @@ This module provides functionality to scan directories for media files
 and classify them based on file extensions and patterns.
 """
 
+import contextlib
+import functools
 import logging
+import os
 import re
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple, Union, cast
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 from namegnome.models.core import MediaFile, MediaType, ScanResult
 from namegnome.utils.hash import sha256sum
@@ -47,6 +51,18 @@ MEDIA_EXTENSIONS = {
     },
 }
 
+# Inverted view of MEDIA_EXTENSIONS used for one-lookup classification.
+# Reason: UNKNOWN is the fallback rather than a real candidate, so it is left
+# out; every extension it lists is covered by at least one concrete type.
+_EXT_TO_TYPES: Dict[str, frozenset[MediaType]] = {
+    ext: frozenset(
+        media_type
+        for media_type, extensions in MEDIA_EXTENSIONS.items()
+        if media_type is not MediaType.UNKNOWN and ext in extensions
+    )
+    for ext in set().union(*MEDIA_EXTENSIONS.values())
+}
+
 # IGNORED_EXTENSIONS covers common sidecar, subtitle, and metadata files that
 # should never be treated as media.
 # Reason: These files are not ingested by media servers as primary content and
@@ -74,6 +90,16 @@ IGNORED_EXTENSIONS = {
     ".url",
 }
 
+# Reason: files are matched against the target media suffixes only. No media
+# extension overlaps an ignored one (neither ends with the other), so a name
+# that ends with a target suffix can never also end with an ignored suffix and
+# the ignored set needs no per-file check.
+assert not any(
+    media.endswith(ignored) or ignored.endswith(media)
+    for media in set().union(*MEDIA_EXTENSIONS.values())
+    for ignored in (ext.lower() for ext in IGNORED_EXTENSIONS)
+), "MEDIA_EXTENSIONS and IGNORED_EXTENSIONS must not overlap"
+
 # TV_PATTERNS are derived from the most common episode naming conventions in the
 # media server ecosystem.
 # Reason: These patterns are recommended in the MEDIA-SERVER FILE-NAMING &
@@ -87,6 +113,41 @@ TV_PATTERNS = [
     r"\b(?:s|season)\s*\d+\b.*\b(?:e|episode)\s*\d+\b",  # Season X Episode Y pattern
 ]
 
+# Reason: guess_media_type runs once per scanned file, so the movie-year and
+# TV patterns are compiled a single time at import into one regex. Within the
+# text it is given, the anchored lookahead lets a year win over a TV pattern
+# while both checks run in a single call. guess_media_type matches the file
+# name first and falls back to the parent directory only when the name has no
+# hint, so a TV-style name inside a "Movie (2020)" folder is still TV.
+_CLASSIFY_RE = re.compile(
+    r"\A(?:(?=.*?(?P<movie>\(\d{4}\)))|.*?(?P<tv>"
+    + "|".join(f"(?:{pattern})" for pattern in TV_PATTERNS)
+    + "))",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Directories that never hold library media: VCS and tooling folders, plus
+# OS/NAS metadata and trash stashes.
+# Reason: Synology @eaDir thumbnails and macOS resource forks can outnumber the
+# real media files, so these subtrees are pruned before they are walked (even
+# when hidden entries are included).
+_SKIP_DIRS = frozenset(
+    {
+        ".git",
+        "node_modules",
+        "@eaDir",
+        ".AppleDouble",
+        "$RECYCLE.BIN",
+        "System Volume Information",
+        "__MACOSX",
+    }
+)
+
+# Upper bound on threads used to list directories in parallel.
+# Reason: the walk is I/O-bound, so oversubscribing the CPU count helps keep
+# the disk (or network share) busy without spawning unbounded threads.
+_SCAN_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 # Directory hints are used to infer media type from parent folder names.
 # Reason: Most media libraries are organized by top-level folders (e.g., Movies/,
 # TV/, Music/), so this provides a strong hint when file patterns are ambiguous.
@@ -96,6 +157,12 @@ DIRECTORY_HINTS = {
     MediaType.MUSIC: {"music", "audio", "songs", "albums", "mp3"},
 }
 
+# Flat folder-name -> MediaType view of DIRECTORY_HINTS for one lookup per
+# ancestor directory.
+_HINT_TO_TYPE: Dict[str, MediaType] = {
+    hint: media_type for media_type, hints in DIRECTORY_HINTS.items() for hint in hints
+}
+
 
 def is_hidden(path: Path) -> bool:
     """Check if a path is hidden (starts with a dot).
@@ -109,48 +176,51 @@ def is_hidden(path: Path) -> bool:
     return any(part.startswith(".") for part in path.parts)
 
 
-def _check_movie_pattern(path_str: str) -> bool:
-    """Check if path matches movie pattern (year in parentheses).
+def _check_name_patterns(path_str: str) -> Optional[MediaType]:
+    """Check if path matches the movie-year or any TV show pattern.
 
     Args:
         path_str: Path string to check
 
     Returns:
-        True if matches movie pattern, False otherwise
+        MediaType.MOVIE for a year in parentheses, MediaType.TV for a TV
+        pattern, or None if neither matches
     """
-    movie_pattern = re.compile(r"\(\d{4}\)", re.IGNORECASE)
-    return bool(movie_pattern.search(path_str))
+    match = _CLASSIFY_RE.match(path_str)
+    if match is None:
+        return None
+    return MediaType.MOVIE if match.group("movie") is not None else MediaType.TV
 
 
-def _check_tv_patterns(path_str: str) -> bool:
-    """Check if path matches any TV show patterns.
+def _check_directory_hints(path: Path) -> Optional[MediaType]:
+    """Check parent directories for media type hints.
 
     Args:
-        path_str: Path string to check
+        path: File path to check
 
     Returns:
-        True if matches any TV pattern, False otherwise
+        Detected MediaType or None if no hints found
     """
-    tv_patterns_compiled = [
-        re.compile(pattern, re.IGNORECASE) for pattern in TV_PATTERNS
-    ]
-    return any(pattern.search(path_str) for pattern in tv_patterns_compiled)
+    return _dir_hint(path.parent)
 
 
-def _check_directory_hints(path: Path) -> Optional[MediaType]:
-    """Check parent directories for media type hints.
+# Reason: files in the same folder share every ancestor, so the hint walk is
+# memoized per parent directory and runs once per directory rather than once
+# per file.
+@functools.lru_cache(maxsize=8192)
+def _dir_hint(directory: Path) -> Optional[MediaType]:
+    """Return the media type hinted by *directory* or its nearest ancestor.
 
     Args:
-        path: File path to check
+        directory: Directory whose name and ancestors are checked
 
     Returns:
         Detected MediaType or None if no hints found
     """
-    for parent in path.parents:
-        parent_name = parent.name.lower()
-        for media_type, hints in DIRECTORY_HINTS.items():
-            if parent_name in hints:
-                return media_type
+    for parent in (directory, *directory.parents):
+        media_type = _HINT_TO_TYPE.get(parent.name.lower())
+        if media_type is not None:
+            return media_type
     return None
 
 
@@ -167,18 +237,24 @@ def guess_media_type(path: Path) -> MediaType:
     ext = path.suffix.lower()
 
     # If it's not a known media extension, return UNKNOWN
-    if not any(ext in extensions for extensions in MEDIA_EXTENSIONS.values()):
+    types_for_ext = _EXT_TO_TYPES.get(ext)
+    if not types_for_ext:
         return MediaType.UNKNOWN
 
-    path_str = str(path).lower()
-
-    # First check for movie pattern - this is a strong indicator
-    if _check_movie_pattern(path_str):
-        return MediaType.MOVIE
-
-    # Check for TV show patterns in the filename
-    if _check_tv_patterns(path_str):
-        return MediaType.TV
+    # Extensions owned by a single media type (e.g. audio formats) need no
+    # pattern or directory checks; only shared video extensions do.
+    if len(types_for_ext) == 1:
+        (media_type,) = types_for_ext
+        return media_type
+
+    # Movie year is a strong indicator, then TV show patterns. Only the file
+    # name is lowercased for the common case; the folder part of the path is
+    # materialized only when the name itself carries no hint.
+    pattern_hint = _check_name_patterns(path.name.lower()) or _check_name_patterns(
+        str(path.parent).lower()
+    )
+    if pattern_hint:
+        return pattern_hint
 
     # Look at parent directory names for hints
     directory_hint = _check_directory_hints(path)
@@ -189,51 +265,29 @@ def guess_media_type(path: Path) -> MediaType:
     return MediaType.UNKNOWN
 
 
-def _is_valid_media_file(
-    file_path: Path, target_extensions: Set[str], media_types: List[MediaType]
-) -> bool:
-    """Check if a file is a valid media file based on extension and media type.
-
-    Args:
-        file_path: Path to the file
-        target_extensions: Set of extensions to include
-        media_types: List of media types to include
-
-    Returns:
-        True if file should be included, False if it should be skipped
-    """
-    # Skip based on extension
-    ext = file_path.suffix.lower()
-    if ext in IGNORED_EXTENSIONS or ext not in target_extensions:
-        return False
-
-    # Guess the media type
-    media_type = guess_media_type(file_path)
-    # Only include if the guessed type is in the allowed list
-    return media_type in media_types
-
-
 def _create_media_file(
-    file_path: Path, verify_hash: bool, errors: List[str]
-) -> Tuple[MediaFile, MediaType]:
-    """Create a MediaFile object from a file path.
+    entry: "os.DirEntry[str]",
+    file_path: Path,
+    media_type: MediaType,
+    verify_hash: bool,
+    errors: List[str],
+) -> MediaFile:
+    """Create a MediaFile object from a directory entry.
 
     Args:
+        entry: Directory entry for the file (its stat result is reused)
         file_path: Path to the file
+        media_type: Media type already guessed for the file
         verify_hash: Whether to compute the file hash
         errors: List to append any errors to
 
     Returns:
-        Tuple of (MediaFile, MediaType)
+        The MediaFile for the path
     """
-    # Guess media type
-    media_type = guess_media_type(file_path)
-
     try:
-        # Get file size and modified date
-        stat = file_path.stat()
+        # Get file size and modified time
+        stat = entry.stat()
         size = stat.st_size
-        modified_date = datetime.fromtimestamp(stat.st_mtime)
 
         # Compute hash if requested
         file_hash = None
@@ -244,32 +298,34 @@ def _create_media_file(
                 # Log but continue if hash can't be computed
                 errors.append(f"Failed to compute hash for {file_path}: {str(e)}")
 
-        # Create the MediaFile object
+        # Create the MediaFile object. Reason: the regular constructor is used
+        # on purpose; pydantic-core validation is cheaper than model_construct,
+        # which resolves every default in Python on current pydantic releases.
         media_file = MediaFile(
-            path=file_path.absolute(),
+            path=file_path,
             size=size,
             media_type=media_type,
-            modified_date=modified_date,
+            modified_ts=stat.st_mtime,
             hash=file_hash,
         )
 
-        return media_file, media_type
+        return media_file
     except (PermissionError, FileNotFoundError, OSError) as e:
         # Log the error and return a placeholder
         errors.append(f"Error accessing {file_path}: {str(e)}")
         # Return a placeholder with minimal information
         media_file = MediaFile(
-            path=file_path.absolute(),
+            path=file_path,
             size=0,
             media_type=media_type,
-            modified_date=datetime.now(),
+            modified_ts=time.time(),
         )
-        return media_file, media_type
+        return media_file
 
 
 def _process_file(
-    file_path: Path,
-    target_extensions: Set[str],
+    entry: "os.DirEntry[str]",
+    target_suffixes: Tuple[str, ...],
     media_types: List[MediaType],
     verify_hash: bool,
     errors: List[str],
@@ -277,8 +333,8 @@ def _process_file(
     """Process a single file and create a MediaFile if it's a valid media file.
 
     Args:
-        file_path: Path to the file
-        target_extensions: Set of extensions to include
+        entry: Directory entry for the file
+        target_suffixes: Lower-case extensions to include
         media_types: List of media types to include
         verify_hash: Whether to compute file hash
         errors: List to append any errors to
@@ -287,18 +343,26 @@ def _process_file(
         Tuple of (MediaFile or None, MediaType, whether the file was skipped)
     """
     try:
-        # Check if it's a valid media file
-        if not _is_valid_media_file(file_path, target_extensions, media_types):
-            # Return placeholder for skipped files
-            media_type = guess_media_type(file_path)
+        # Skip based on extension before building a Path or doing pattern work.
+        # Reason: str.endswith tests every suffix in one C call, which is
+        # cheaper than splitting off the extension for each rejected file.
+        if not entry.name.lower().endswith(target_suffixes):
+            return None, MediaType.UNKNOWN, True
+
+        # Guess the media type once and reuse it for filtering and creation
+        file_path = Path(entry.path)
+        media_type = guess_media_type(file_path)
+        if media_type not in media_types:
             return None, media_type, True
 
         # Create the MediaFile object
-        media_file, media_type = _create_media_file(file_path, verify_hash, errors)
+        media_file = _create_media_file(
+            entry, file_path, media_type, verify_hash, errors
+        )
         return media_file, media_type, False
     except Exception as e:
         # Log unexpected errors but continue processing
-        errors.append(f"Unexpected error processing {file_path}: {str(e)}")
+        errors.append(f"Unexpected error processing {entry.path}: {str(e)}")
         return None, MediaType.UNKNOWN, True
 
 
@@ -312,108 +376,241 @@ class ScanOptions:
     platform: str = "plex"
     target_extensions: Set[str] = field(default_factory=set)
     media_types: List[MediaType] = field(default_factory=list)
+    # Concurrent stat() calls issued ahead of the scanner for media files;
+    # 0 disables prefetching. Reason: off by default since it only pays off
+    # when stat() is slow (cold network shares) and adds thread overhead on
+    # local disks with a warm cache.
+    prefetch_depth: int = 0
+    # Derived from target_extensions by scan_directory for the endswith check
+    target_suffixes: Tuple[str, ...] = field(default=(), init=False, repr=False)
+
 
+# A directory listing in walk order: processed files (see _process_file) with
+# subdirectory paths in the positions they were listed at.
+_DirectoryNodes = list[str | tuple[MediaFile | None, MediaType, bool]]
 
-def _handle_directory_item(
-    item: Path,
+
+class _StatPrefetcher:
+    """Warms file stat()s on a small pool with a bounded number in flight.
+
+    Reason: on a cold cache (or a network share) each stat() the scanner makes
+    is a blocking round-trip. Issuing a few of them ahead of the scanner means
+    it then finds the inode already cached. One instance is shared by every
+    directory walker, so prefetch_depth caps the prefetches in flight for the
+    whole scan, not per directory.
+    """
+
+    def __init__(self, depth: int) -> None:
+        self._pool = ThreadPoolExecutor(
+            max_workers=depth, thread_name_prefix="namegnome-prefetch"
+        )
+        self._slots = threading.BoundedSemaphore(depth)
+
+    def submit(self, path: str) -> bool:
+        """Queue a stat() of *path*; return False when the window is full."""
+        if not self._slots.acquire(blocking=False):
+            return False
+        try:
+            future = self._pool.submit(os.stat, path)
+        except RuntimeError:  # pool already shut down
+            self._slots.release()
+            return False
+        # Results and errors are discarded; the scanner's own stat() call
+        # still reports any failure.
+        future.add_done_callback(self._release)
+        return True
+
+    def _release(self, _future: "Future[os.stat_result]") -> None:
+        self._slots.release()
+
+    def shutdown(self) -> None:
+        """Stop the pool, dropping prefetches that have not started yet."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _prefetch_candidates(
+    entries: list["os.DirEntry[str]"], options: ScanOptions
+) -> list[str]:
+    """Return paths of the entries the scanner will stat(), in scan order.
+
+    Mirrors the filters of _scan_one_directory and _process_file (hidden
+    names, files only, target extensions) so that nothing is prefetched that
+    the walk skips anyway.
+    """
+    paths: list[str] = []
+    for entry in entries:
+        if entry.name.startswith(".") and not options.include_hidden:
+            continue
+        if not entry.name.lower().endswith(options.target_suffixes):
+            continue
+        try:
+            if entry.is_file():
+                paths.append(entry.path)
+        except OSError:
+            continue
+    return paths
+
+
+def _prefetch_ahead(prefetcher: _StatPrefetcher, paths: list[str], start: int) -> int:
+    """Submit ``paths[start:]`` until the window is full; return the next index."""
+    while start < len(paths) and prefetcher.submit(paths[start]):
+        start += 1
+    return start
+
+
+def _scan_one_directory(
+    directory: str,
     options: ScanOptions,
-) -> Tuple[int, int, List[MediaFile], Dict[MediaType, int], List[str]]:
-    """Handle a single directory item (file or subdirectory).
+    prefetcher: _StatPrefetcher | None = None,
+) -> tuple[_DirectoryNodes, list[str]]:
+    """List one directory and process the files directly inside it.
+
+    Hidden entries and _SKIP_DIRS are pruned here. Subdirectories are not
+    descended into; their paths are returned so the caller can queue them.
 
     Args:
-        item: Path to the item
+        directory: Directory to list
         options: Scan options
+        prefetcher: Optional pool to warm file stat()s on (see _StatPrefetcher)
 
     Returns:
-        Tuple of (
-            total files examined,
-            skipped files,
-            list of media files found,
-            count by media type,
-            list of errors
-        )
+        Tuple of (directory nodes in os.scandir order, list of errors)
     """
-    # Initialize results
-    total_files = 0
-    skipped_files = 0
-    media_files: List[MediaFile] = []
-    by_media_type: Dict[MediaType, int] = {}
-    errors: List[str] = []
-
-    # Check if it's a hidden item
-    if is_hidden(item) and not options.include_hidden:
-        return total_files, skipped_files, media_files, by_media_type, errors
-
+    nodes: _DirectoryNodes = []
+    errors: list[str] = []
     try:
-        if item.is_file():
-            # Process the file
-            total_files += 1
-            media_file, media_type, was_skipped = _process_file(
-                item,
-                options.target_extensions,
-                options.media_types,
-                options.verify_hash,
-                errors,
-            )
-
-            if was_skipped:
-                skipped_files += 1
-            elif media_file is not None:
-                media_files.append(media_file)
-                # Update count by media type
-                by_media_type[media_type] = by_media_type.get(media_type, 0) + 1
-
-        elif item.is_dir() and options.recursive:
-            # For hidden directories, we need to check again for include_hidden
-            if not is_hidden(item) or options.include_hidden:
-                # Recursively process subdirectory
-                sub_results = _process_directory(item, options)
-                _update_aggregated_results(
-                    [total_files, skipped_files, media_files, by_media_type, errors],
-                    sub_results,
-                )
-    except (PermissionError, FileNotFoundError, OSError) as e:
-        # Log access errors but continue processing
-        errors.append(f"Error accessing {item}: {str(e)}")
-
-    return total_files, skipped_files, media_files, by_media_type, errors
-
+        # os.scandir raises for missing or non-directory paths, which is
+        # reported like any access error.
+        with os.scandir(directory) as it:
+            entries = list(it)
+            # Prefetching runs a window ahead of the entry being processed:
+            # the first candidate is left to the scanner (a prefetch would
+            # only race it) and each candidate reached tops the window up.
+            ahead: list[str] = []
+            reached = next_ahead = 0
+            if prefetcher is not None:
+                ahead = _prefetch_candidates(entries, options)
+                next_ahead = _prefetch_ahead(prefetcher, ahead, 1)
+            for entry in entries:
+                # Parents were already checked on the way down
+                if entry.name.startswith(".") and not options.include_hidden:
+                    continue
+                if (
+                    prefetcher is not None
+                    and reached < len(ahead)
+                    and entry.path == ahead[reached]
+                ):
+                    reached += 1
+                    next_ahead = _prefetch_ahead(
+                        prefetcher, ahead, max(next_ahead, reached)
+                    )
+                try:
+                    # Reason: DirEntry caches the file type from the directory
+                    # read, so these checks avoid the extra stat() call per
+                    # entry that Path needs.
+                    if entry.is_file():
+                        nodes.append(
+                            _process_file(
+                                entry,
+                                options.target_suffixes,
+                                options.media_types,
+                                options.verify_hash,
+                                errors,
+                            )
+                        )
+                    elif (
+                        options.recursive
+                        and entry.name not in _SKIP_DIRS
+                        and entry.is_dir(follow_symlinks=False)
+                    ):
+                        nodes.append(entry.path)
+                except OSError as e:
+                    errors.append(f"Error accessing {entry.path}: {str(e)}")
+    except OSError as e:
+        errors.append(f"Error accessing directory {directory}: {str(e)}")
+    return nodes, errors
+
+
+def _scan_tree(
+    root_dir: str,
+    options: ScanOptions,
+    prefetcher: _StatPrefetcher | None = None,
+) -> dict[str, tuple[_DirectoryNodes, list[str]]]:
+    """List every directory below the root on a pool of worker threads.
 
-def _update_aggregated_results(
-    aggregated: list[Union[int, List[MediaFile], Dict[MediaType, int], List[str]]],
-    additional: Tuple[int, int, List[MediaFile], Dict[MediaType, int], List[str]],
-) -> None:
-    """Update aggregated results with additional results.
+    Reason: directory reads and stat calls release the GIL but are
+    latency-bound, so a single walker leaves the disk (or network share)
+    idle. Each directory is one task and the subdirectories it finds are
+    queued as new tasks, so deep or lopsided trees spread across all workers
+    instead of one thread per top-level folder.
 
     Args:
-        aggregated: List of aggregated results (will be modified in-place)
-        additional: Tuple of additional results
+        root_dir: Root directory to walk
+        options: Scan options
+        prefetcher: Optional pool to warm file stat()s on
 
     Returns:
-        None (updates aggregated in-place)
+        Mapping of directory path to its _scan_one_directory result
     """
-    # Update total_files
-    aggregated[0] = cast(int, aggregated[0]) + additional[0]
-    # Update skipped_files
-    aggregated[1] = cast(int, aggregated[1]) + additional[1]
-    # Update media_files
-    cast(List[MediaFile], aggregated[2]).extend(additional[2])
-    # Update by_media_type
-    by_media_type = cast(Dict[MediaType, int], aggregated[3])
-    for media_type, count in additional[3].items():
-        by_media_type[media_type] = by_media_type.get(media_type, 0) + count
-    # Update errors
-    cast(List[str], aggregated[4]).extend(additional[4])
-
-
-def _process_directory(
-    current_dir: Path,
+    results: dict[str, tuple[_DirectoryNodes, list[str]]] = {}
+    failures: list[BaseException] = []
+    lock = threading.Lock()
+    finished = threading.Event()
+    outstanding = 0
+
+    with ThreadPoolExecutor(max_workers=_SCAN_MAX_WORKERS) as executor:
+
+        def _done() -> None:
+            nonlocal outstanding
+            with lock:
+                outstanding -= 1
+                if outstanding == 0:
+                    finished.set()
+
+        def _submit(directory: str) -> None:
+            nonlocal outstanding
+            # Reason: count the task before submitting it, so a parent task
+            # cannot finish and drop the count to zero while its child is
+            # still being queued. A failed submit undoes its own count.
+            with lock:
+                outstanding += 1
+            try:
+                executor.submit(_task, directory)
+            except BaseException as e:  # surfaced on the calling thread below
+                failures.append(e)
+                _done()
+
+        def _task(directory: str) -> None:
+            try:
+                listing = _scan_one_directory(directory, options, prefetcher)
+                results[directory] = listing
+                for node in listing[0]:
+                    if isinstance(node, str):
+                        _submit(node)
+            except BaseException as e:  # surfaced on the calling thread below
+                failures.append(e)
+            finally:
+                _done()
+
+        _submit(root_dir)
+        finished.wait()
+    if failures:
+        raise failures[0]
+    return results
+
+
+def _process_root_directory(
+    root_dir: Path,
     options: ScanOptions,
-) -> Tuple[int, int, List[MediaFile], Dict[MediaType, int], List[str]]:
-    """Process a directory and find media files.
+) -> tuple[int, int, list[MediaFile], dict[MediaType, int], list[str]]:
+    """Process the scan root and, when recursive, every directory below it.
+
+    Directories are listed in parallel (see _scan_tree), then the results are
+    merged depth first in os.scandir order so the output is deterministic and
+    matches a sequential walk.
 
     Args:
-        current_dir: Directory to process
+        root_dir: Root directory to process
         options: Scan options
 
     Returns:
@@ -425,44 +622,57 @@ def _process_directory(
             list of errors
         )
     """
-    # Initialize results
+    root = os.fspath(root_dir)
+    with contextlib.ExitStack() as cleanup:
+        prefetcher: _StatPrefetcher | None = None
+        if options.prefetch_depth > 0:
+            prefetcher = _StatPrefetcher(options.prefetch_depth)
+            # Prefetches still queued once the walk is done are useless; drop
+            # them rather than waiting for them.
+            cleanup.callback(prefetcher.shutdown)
+        if options.recursive:
+            listings = _scan_tree(root, options, prefetcher)
+        else:
+            listings = {root: _scan_one_directory(root, options, prefetcher)}
+
     total_files = 0
     skipped_files = 0
-    media_files: List[MediaFile] = []
-    by_media_type: Dict[MediaType, int] = {}
-    errors: List[str] = []
-
-    # Check if it's a hidden directory
-    if is_hidden(current_dir) and not options.include_hidden:
-        return total_files, skipped_files, media_files, by_media_type, errors
-
-    # Skip directory if it doesn't exist or can't be accessed
-    if not current_dir.exists():
-        errors.append(f"Directory does not exist: {current_dir}")
-        return total_files, skipped_files, media_files, by_media_type, errors
-    elif not current_dir.is_dir():
-        errors.append(f"Path is not a directory: {current_dir}")
-        return total_files, skipped_files, media_files, by_media_type, errors
-
-    try:
-        # Process each item in the directory
-        for item in current_dir.iterdir():
-            item_results = _handle_directory_item(item, options)
-            _update_aggregated_results(
-                [total_files, skipped_files, media_files, by_media_type, errors],
-                item_results,
-            )
-    except (PermissionError, OSError) as e:
-        errors.append(f"Error accessing directory {current_dir}: {str(e)}")
+    media_files: list[MediaFile] = []
+    by_media_type: dict[MediaType, int] = {}
+    errors: list[str] = []
+
+    # Iterative depth-first merge; an explicit stack avoids recursion limits
+    # on very deep trees.
+    nodes, dir_errors = listings[root]
+    errors.extend(dir_errors)
+    stack: list[Iterator[str | tuple[MediaFile | None, MediaType, bool]]]
+    stack = [iter(nodes)]
+    while stack:
+        for node in stack[-1]:
+            if isinstance(node, str):
+                nodes, dir_errors = listings[node]
+                errors.extend(dir_errors)
+                stack.append(iter(nodes))
+                break
+            total_files += 1
+            media_file, media_type, was_skipped = node
+            if was_skipped:
+                skipped_files += 1
+            elif media_file is not None:
+                media_files.append(media_file)
+                # Update count by media type
+                by_media_type[media_type] = by_media_type.get(media_type, 0) + 1
+        else:
+            stack.pop()
 
     return total_files, skipped_files, media_files, by_media_type, errors
 
 
 def scan_directory(
     root_dir: Path,
-    media_types: List[MediaType] | None = None,
+    media_types: list[MediaType] | None = None,
     *,  # Force the rest of the parameters to be keyword-only
-    options: Optional[ScanOptions] = None,
+    options: ScanOptions | None = None,
 ) -> ScanResult:
     """Scan a directory for media files.
 
@@ -485,7 +695,9 @@ def scan_directory(
     if not root_dir.is_dir():
         raise ValueError(f"Path is not a directory: {root_dir}")
 
-    # Use absolute path to avoid relative path issues
+    # Use absolute path to avoid relative path issues. os.scandir yields
+    # entries joined onto this base, so every discovered file path is already
+    # absolute and needs no per-file resolution.
     root_dir = root_dir.absolute()
 
     # Set up options with defaults if none provided
@@ -508,40 +720,49 @@ def scan_directory(
     for media_type in options.media_types:
         if media_type in MEDIA_EXTENSIONS:
             options.target_extensions.update(MEDIA_EXTENSIONS[media_type])
+    options.target_suffixes = tuple(options.target_extensions)
 
     # Start timing the scan
     start_time = time.time()
 
-    # Process the directory
-    total_files, skipped_files, media_files, by_media_type, errors = _process_directory(
-        root_dir, options
-    )
+    # Process the directory. Hidden entries are filtered by name while walking,
+    # so the full-path hidden check is only needed once, for the root itself.
+    if is_hidden(root_dir) and not options.include_hidden:
+        total_files, skipped_files = 0, 0
+        media_files: list[MediaFile] = []
+        by_media_type: dict[MediaType, int] = {}
+        errors: list[str] = []
+    else:
+        total_files, skipped_files, media_files, by_media_type, errors = (
+            _process_root_directory(root_dir, options)
+        )
 
     # Calculate scan duration
     scan_duration = time.time() - start_time
 
-    # For backward compatibility with tests
-    total_files_examined = total_files
-    skipped_files_count = skipped_files
-    media_files_list = media_files
-    by_media_type_dict = by_media_type
-    errors_list = errors
-    scan_duration_seconds = scan_duration
+    # Reason: Summarize once after the walk rather than logging per file, so
+    # log handlers stay out of the hot loop on large, noisy trees.
+    if errors:
+        logger.warning(
+            "Scan of %s: %d error(s), %d of %d file(s) skipped",
+            root_dir,
+            len(errors),
+            skipped_files,
+            total_files,
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            for error in errors:
+                logger.debug(error)
 
     # Create and return the scan result
-    result = ScanResult(
-        files=media_files_list,
+    return ScanResult(
+        files=media_files,
         root_dir=root_dir,
         media_types=options.media_types,
         platform=options.platform,
-        # Include backward compatibility fields
-        total_files=max(
-            total_files_examined, len(media_files_list)
-        ),  # Ensure total files is at least the number of files found
-        skipped_files=skipped_files_count,
-        by_media_type=by_media_type_dict,
-        errors=errors_list,
-        scan_duration_seconds=scan_duration_seconds,
+        total_files=total_files,
+        skipped_files=skipped_files,
+        by_media_type=by_media_type,
+        errors=errors,
+        scan_duration_seconds=scan_duration,
     )
-
-    return result
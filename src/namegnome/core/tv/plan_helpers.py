@@ -26,8 +26,10 @@ def _find_best_episode_match(
     best_episode: TVEpisode | None = None
     best_title: str | None = None
 
+    # Lowercase the query once rather than once per candidate episode.
+    lower_seg = segment.lower()
     for ep in episode_list:
-        score = SequenceMatcher(None, segment.lower(), ep.title.lower()).ratio() * 100
+        score = SequenceMatcher(None, lower_seg, ep.title.lower()).ratio() * 100
         if score > best_score:
             best_score = score
             best_episode = ep
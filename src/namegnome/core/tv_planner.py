@@ -147,6 +147,7 @@ def _anthology_single_segment_fallback(
     Attempts to match a segment to a single episode using fuzzy matching.
     Returns matched episodes and titles if a confident match is found.
     """
+    # Normalize the segment once; it is compared against every candidate title.
     norm_seg = sanitize_title_tv(seg)
     norm_titles = [sanitize_title_tv(t) for t in episode_titles]
     found_titles = [t for t in norm_titles if t in norm_seg]
@@ -157,7 +158,7 @@ def _anthology_single_segment_fallback(
         from rapidfuzz import fuzz
 
         for idx, ep_title in enumerate(sanitized_episode_titles):
-            score = fuzz.ratio(sanitize_title_tv(seg), ep_title)
+            score = fuzz.ratio(norm_seg, ep_title)
             if score > best_score:
                 best_score = score
                 best = episode_titles[idx]
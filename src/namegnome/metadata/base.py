@@ -5,10 +5,15 @@ used by NameGnome. All provider clients must inherit from this class and impleme
 its methods. See PLANNING.md and TASK.md for requirements.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 
 from namegnome.metadata.models import MediaMetadata
 
+# Default cap on concurrent provider requests issued by the bulk helpers.
+DEFAULT_MAX_CONCURRENCY = 8
+
 
 class MetadataClient(ABC):
     """Abstract base class for all metadata provider clients.
@@ -47,3 +52,31 @@ class MetadataClient(ABC):
             NotImplementedError: If not implemented by subclass.
         """
         raise NotImplementedError
+
+    async def details_bulk(
+        self,
+        provider_ids: Iterable[str],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> list[MediaMetadata]:
+        """Fetch details for many provider-specific IDs concurrently.
+
+        Args:
+            provider_ids: The unique IDs in the provider's system.
+            max_concurrency: Maximum number of ``details`` calls in flight.
+
+        Returns:
+            MediaMetadata objects in the same order as *provider_ids*.
+
+        Reason:
+            Awaiting ``details`` once per ID in a loop costs roughly N times the
+            provider latency; a bounded concurrent wave costs roughly one, while
+            the semaphore keeps providers' rate limits in mind. Subclasses that
+            can fetch many IDs in one request may override this.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _fetch(provider_id: str) -> MediaMetadata:
+            async with semaphore:
+                return await self.details(provider_id)
+
+        return list(await asyncio.gather(*(_fetch(pid) for pid in provider_ids)))
@@ -15,13 +15,12 @@ from namegnome.metadata.cache import cache
 from namegnome.metadata.clients.omdb import fetch_and_merge_omdb
 from namegnome.metadata.models import ArtworkImage, MediaMetadata, MediaMetadataType
 from namegnome.metadata.settings import Settings
+from namegnome.metadata.utils import extract_year
 
 # mypy: ignore-errors
 # See docs/KNOWN_ISSUES.md for context on the persistent mypy false positive in
 # this file.
 
-YEAR_LENGTH = 4  # Minimum length for a valid year string
-
 
 class TMDBClient(MetadataClient):
     """Client for The Movie Database (TMDB) API.
@@ -59,7 +58,7 @@ class TMDBClient(MetadataClient):
             data = resp.json()
         for item in data.get("results", []):
             # Remove debug logging to resolve E501
-            year: int | None = _extract_year(item.get("release_date"))
+            year: int | None = extract_year(item.get("release_date"))
             media = MediaMetadata(
                 title=item["title"],
                 media_type=MediaMetadataType.MOVIE,
@@ -89,7 +88,7 @@ class TMDBClient(MetadataClient):
                     overview=item.get("overview"),
                     provider="tmdb",
                     provider_id=str(item["id"]),
-                    year=_extract_year(item.get("first_air_date")),
+                    year=extract_year(item.get("first_air_date")),
                     vote_average=item.get("vote_average"),
                     vote_count=item.get("vote_count"),
                     popularity=item.get("popularity"),
@@ -138,7 +137,7 @@ class TMDBClient(MetadataClient):
                         )
                     )
                 logging.debug(f"TMDB details: id={data['id']}")
-                year: int | None = _extract_year(data.get("release_date"))
+                year: int | None = extract_year(data.get("release_date"))
                 meta = MediaMetadata(
                     title=data["title"],
                     media_type=MediaMetadataType.MOVIE,
@@ -188,7 +187,7 @@ class TMDBClient(MetadataClient):
                     overview=data.get("overview"),
                     provider="tmdb",
                     provider_id=str(data["id"]),
-                    year=_extract_year(data.get("first_air_date")),
+                    year=extract_year(data.get("first_air_date")),
                     vote_average=data.get("vote_average"),
                     vote_count=data.get("vote_count"),
                     popularity=data.get("popularity"),
@@ -196,10 +195,3 @@ class TMDBClient(MetadataClient):
                 )
             else:
                 raise ValueError(f"Unsupported media_type: {media_type}")
-
-
-def _extract_year(date_str: str | None) -> int | None:
-    """Extracts the year as int from a YYYY-MM-DD string, or returns None."""
-    if date_str and len(date_str) >= YEAR_LENGTH and date_str[:YEAR_LENGTH].isdigit():
-        return int(date_str[:YEAR_LENGTH])
-    return None
@@ -5,8 +5,10 @@ Implements the MetadataClient interface for TheTVDB API.
 
 import os
 from http import HTTPStatus
+from typing import Any
 
 import httpx
+from pydantic import TypeAdapter
 
 from namegnome.metadata.base import MetadataClient
 from namegnome.metadata.models import (
@@ -15,6 +17,27 @@ from namegnome.metadata.models import (
     MediaMetadataType,
     TVEpisode,
 )
+from namegnome.metadata.utils import extract_year
+
+# Reason: one validator call per page of episodes rather than one model
+# constructor call per episode; pydantic-core validates the whole list in Rust.
+_EPISODE_LIST_ADAPTER: TypeAdapter[list[TVEpisode]] = TypeAdapter(list[TVEpisode])
+
+
+def _episodes_from_page(data: list[dict[str, Any]]) -> list[TVEpisode]:
+    """Map one page of TVDB episode records to validated TVEpisode models."""
+    return _EPISODE_LIST_ADAPTER.validate_python(
+        [
+            {
+                "title": ep["episodeName"],
+                "episode_number": ep["airedEpisodeNumber"],
+                "season_number": ep["airedSeason"],
+                "air_date": None,
+                "overview": ep.get("overview"),
+            }
+            for ep in data
+        ]
+    )
 
 
 class TVDBClient(MetadataClient):
@@ -79,16 +102,7 @@ class TVDBClient(MetadataClient):
                         # Use new token for subsequent requests
                         headers = headers2
                     ep_json = ep_resp.json()
-                    for ep in ep_json["data"]:
-                        episodes.append(
-                            TVEpisode(
-                                title=ep["episodeName"],
-                                episode_number=ep["airedEpisodeNumber"],
-                                season_number=ep["airedSeason"],
-                                air_date=None,
-                                overview=ep.get("overview"),
-                            )
-                        )
+                    episodes.extend(_episodes_from_page(ep_json["data"]))
                     if not ep_json["links"].get("next"):
                         break
                     page = ep_json["links"]["next"]
@@ -101,9 +115,7 @@ class TVDBClient(MetadataClient):
                     provider_id=series_id,
                     external_ids=ExternalIDs(tvdb_id=series_id),
                     release_date=None,
-                    year=int(series["firstAired"].split("-")[0])
-                    if series.get("firstAired")
-                    else None,
+                    year=extract_year(series.get("firstAired")),
                     artwork=[],
                     runtime=None,
                     genres=[],
@@ -159,16 +171,7 @@ class TVDBClient(MetadataClient):
                     headers=headers,
                 )
                 ep_json = ep_resp.json()
-                for ep in ep_json["data"]:
-                    episodes.append(
-                        TVEpisode(
-                            title=ep["episodeName"],
-                            episode_number=ep["airedEpisodeNumber"],
-                            season_number=ep["airedSeason"],
-                            air_date=None,
-                            overview=ep.get("overview"),
-                        )
-                    )
+                episodes.extend(_episodes_from_page(ep_json["data"]))
                 if not ep_json["links"].get("next"):
                     break
                 page = ep_json["links"]["next"]
@@ -181,9 +184,7 @@ class TVDBClient(MetadataClient):
                 provider_id=str(series["id"]),
                 external_ids=ExternalIDs(tvdb_id=str(series["id"])),
                 release_date=None,
-                year=int(series["firstAired"].split("-")[0])
-                if series.get("firstAired")
-                else None,
+                year=extract_year(series.get("firstAired")),
                 artwork=[],
                 runtime=None,
                 genres=[],
@@ -11,6 +11,7 @@ from typing import Optional
 import httpx
 
 from namegnome.metadata.models import MediaMetadata, MediaMetadataType
+from namegnome.metadata.utils import extract_year
 
 
 class NotFoundError(Exception):
@@ -83,12 +84,7 @@ class MusicBrainzClient:
                     f"Album '{album_title}' by '{artist_name}' not found."
                 )
             release = releases[0]
-            year = None
-            if "date" in release:
-                try:
-                    year = int(release["date"].split("-")[0])
-                except Exception:
-                    year = None
+            year = extract_year(release.get("date"))
             artists = [ac["name"] for ac in release.get("artist-credit", [])]
             return MediaMetadata(
                 title=release["title"],
@@ -16,10 +16,39 @@ Design:
 """
 
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+YEAR_LENGTH = 4  # Number of leading characters holding the year in ISO dates
 
+# ASCII characters normalize_title drops (everything but letters, digits and
+# whitespace), as a bytes.translate deletion table.
+_ASCII_PUNCT_DELETE = bytes(
+    code for code in range(128) if not (chr(code).isalnum() or chr(code).isspace())
+)
+
+
+@lru_cache(maxsize=None)
+def _fixture_index(base_path: Path) -> dict[str, Path]:
+    """Map fixture names to their JSON files in a provider fixture directory.
+
+    Reason: the directory is listed once, so a lookup for a fixture that does
+    not exist is a dict miss instead of a filesystem probe on every call.
+    """
+    try:
+        with os.scandir(base_path) as entries:
+            return {
+                entry.name[: -len(".json")]: Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            }
+    except FileNotFoundError:
+        return {}
+
+
+@lru_cache(maxsize=None)
 def load_fixture(provider: str, fixture_name: str) -> dict[str, Any]:
     """Load a fixture JSON file from the tests/fixtures directory.
 
@@ -28,7 +57,9 @@ def load_fixture(provider: str, fixture_name: str) -> dict[str, Any]:
         fixture_name: The name of the fixture file without extension.
 
     Returns:
-        The loaded JSON data as a dictionary.
+        The loaded JSON data as a dictionary. Results are cached per
+        ``(provider, fixture_name)`` and shared between calls, so callers must
+        copy the data before mutating it.
 
     Raises:
         FileNotFoundError: If the fixture file doesn't exist.
@@ -36,7 +67,10 @@ def load_fixture(provider: str, fixture_name: str) -> dict[str, Any]:
 
     Reason:
         Enables deterministic, offline testing of metadata clients using static
-        JSON files (see tests/fixtures/stubs).
+        JSON files (see tests/fixtures/stubs). Each fixture is read and decoded
+        only once, since stub lookups repeat the same fixtures many times, and
+        each provider directory is listed once, so fixtures added while the
+        process runs are not picked up.
     """
     # Calculate the path relative to the current file
     # When running tests, this will be in the project's test fixtures directory
@@ -44,15 +78,35 @@ def load_fixture(provider: str, fixture_name: str) -> dict[str, Any]:
     # Using parents[3] since: current file -> metadata -> src -> namegnome -> tests
     base_path = Path(__file__).parents[3] / "tests" / "fixtures" / "stubs" / provider
 
-    fixture_path = base_path / f"{fixture_name}.json"
+    fixture_path = _fixture_index(base_path).get(fixture_name)
 
-    if not fixture_path.exists():
-        raise FileNotFoundError(f"Fixture file not found: {fixture_path}")
+    if fixture_path is None:
+        raise FileNotFoundError(
+            f"Fixture file not found: {base_path / f'{fixture_name}.json'}"
+        )
 
     with open(fixture_path, encoding="utf-8") as f:
         return json.load(f)  # type: ignore[no-any-return]
 
 
+def extract_year(date_str: str | None) -> int | None:
+    """Extract the year from an ISO ``YYYY-MM-DD`` (or ``YYYY``) date string.
+
+    Args:
+        date_str: The date string, possibly empty or None.
+
+    Returns:
+        The year as an int, or None if the string does not start with a year.
+
+    Reason:
+        Providers only need the year; slicing the first four characters avoids
+        a full date parse (or split) for every search result.
+    """
+    if date_str and len(date_str) >= YEAR_LENGTH and date_str[:YEAR_LENGTH].isdigit():
+        return int(date_str[:YEAR_LENGTH])
+    return None
+
+
 def normalize_title(title: str) -> str:
     """Normalize a title by removing special characters and converting to lowercase.
 
@@ -66,6 +120,13 @@ def normalize_title(title: str) -> str:
         Ensures consistent, provider-agnostic title matching for fuzzy search and
         deduplication.
     """
+    # Fast path for the common ASCII-only title (no Unicode case or category
+    # rules apply): delete and lowercase at the byte level in C instead of a
+    # per-character generator. The result is identical.
+    if title.isascii():
+        cleaned = title.encode("ascii").translate(None, _ASCII_PUNCT_DELETE)
+        return " ".join(cleaned.lower().decode("ascii").split())
+
     # Remove special characters, extra spaces, and convert to lowercase
     normalized = "".join(c.lower() for c in title if c.isalnum() or c.isspace())
     normalized = " ".join(normalized.split())
@@ -18,12 +18,13 @@ Design:
   schema evolves.
 """
 
+import os
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, computed_field, model_validator
 
 # Avoid circular imports with TYPE_CHECKING
 if TYPE_CHECKING:
@@ -75,8 +76,8 @@ class MediaFile(BaseModel):
     media_type: MediaType
     """Type of media file (TV, movie, music, unknown)."""
 
-    modified_date: datetime
-    """Last modified date of the file (for audit and sorting)."""
+    modified_ts: float = Field(exclude=True, repr=False)
+    """Last modified time as a POSIX timestamp, exactly as reported by stat()."""
 
     season: Optional[int] = None
     """Season number for TV shows (if applicable)."""
@@ -101,6 +102,38 @@ class MediaFile(BaseModel):
     """IDs from external metadata providers, e.g., {'tmdb': '12345'} (for
     enrichment and lookups)."""
 
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def modified_date(self: "MediaFile") -> datetime:
+        """Last modified date of the file (for audit and sorting).
+
+        Reason: Built from modified_ts on access so that scanning does not pay
+        for a datetime per file; it is still serialized like a regular field.
+        """
+        return datetime.fromtimestamp(self.modified_ts)
+
+    @model_validator(mode="before")
+    @classmethod
+    def coerce_modified_date(cls: type["MediaFile"], data: Any) -> Any:  # noqa: ANN401
+        """Accept ``modified_date`` input and store it as ``modified_ts``.
+
+        Keeps callers and previously saved plans that pass a datetime (or an
+        ISO 8601 string) working now that the timestamp is the stored value.
+
+        Returns:
+            The input data with ``modified_date`` converted to ``modified_ts``.
+        """
+        if isinstance(data, dict) and "modified_date" in data:
+            data = dict(data)
+            value = data.pop("modified_date")
+            if "modified_ts" not in data:
+                if isinstance(value, str):
+                    value = datetime.fromisoformat(value)
+                if isinstance(value, datetime):
+                    value = value.timestamp()
+                data["modified_ts"] = value
+        return data
+
     def root_relative_path(self: "MediaFile", root_dir: Path) -> str:
         """Get the path relative to the root directory.
 
@@ -191,7 +224,8 @@ class ScanResult(BaseModel):
         """Convert scan result to a rename plan skeleton.
 
         Args:
-            plan_id: Optional plan ID to use, defaults to timestamp-based ID
+            plan_id: Optional plan ID to use, defaults to a timestamp-based ID
+                suffixed with the process ID
             platform: Optional platform override, defaults to self.platform
 
         Returns:
@@ -199,13 +233,15 @@ class ScanResult(BaseModel):
         """
         from namegnome.models.plan import RenamePlan
 
+        # Reason: one clock read serves both fields, so the default ID always
+        # matches created_at; the PID suffix keeps scans started in the same
+        # second by different processes from sharing an ID.
+        created_at = datetime.now()
+        if plan_id is None:
+            plan_id = f"{created_at:%Y%m%d_%H%M%S}_{os.getpid()}"
         return RenamePlan(
-            id=(
-                plan_id
-                if plan_id is not None
-                else datetime.now().strftime("%Y%m%d_%H%M%S")
-            ),
-            created_at=datetime.now(),
+            id=plan_id,
+            created_at=created_at,
             root_dir=self.root_dir,
             platform=(platform if platform is not None else self.platform),
             media_types=self.media_types,
@@ -27,7 +27,7 @@ See README.md and PLANNING.md for rationale and usage examples.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional, Self
+from typing import TYPE_CHECKING, Optional, Self, Sequence
 
 from namegnome.models.core import MediaFile, MediaType
 
@@ -36,8 +36,9 @@ if TYPE_CHECKING:
 
 
 # Reason: RuleSetConfig groups all options that may affect naming, making it easy
-# to pass config between CLI, planner, and rules.
-@dataclass
+# to pass config between CLI, planner, and rules. It is frozen because the CLI
+# memoizes one instance per option combination and shares it across scans.
+@dataclass(frozen=True)
 class RuleSetConfig:
     """Configuration for rule sets."""
 
@@ -108,6 +109,38 @@ class RuleSet(ABC):
         """
         pass
 
+    def target_paths_batch(
+        self: Self,
+        media_files: Sequence[MediaFile],
+        base_dir: Optional[Path] = None,
+        config: Optional[RuleSetConfig] = None,
+    ) -> list[tuple[MediaFile, Path | ValueError]]:
+        """Generate target paths for many media files in one call.
+
+        The default implementation calls :meth:`target_path` for each file.
+        Subclasses may override it to share per-batch work (compiled patterns,
+        show lookups, ...) across all files.
+
+        Args:
+            media_files: The media files to generate target paths for.
+            base_dir: Optional base directory for the target paths.
+            config: Optional configuration for the rule set.
+
+        Returns:
+            A list of ``(media_file, target)`` pairs in input order. ``target``
+            is the ValueError raised for that file when no path could be
+            generated, so one bad file does not abort the whole batch.
+        """
+        results: list[tuple[MediaFile, Path | ValueError]] = []
+        for media_file in media_files:
+            try:
+                target = self.target_path(media_file, base_dir=base_dir, config=config)
+            except ValueError as e:
+                results.append((media_file, e))
+            else:
+                results.append((media_file, target))
+        return results
+
     @abstractmethod
     def supports_media_type(self: Self, media_type: MediaType) -> bool:
         """Check if this rule set supports the given media type.
@@ -23,16 +23,132 @@ Extensibility:
 See README.md and PLANNING.md for rationale and usage examples.
 """
 
+import os
 import re
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, ClassVar, Optional, Self
+from typing import TYPE_CHECKING, ClassVar, Mapping, Optional, Self
 
 from namegnome.metadata.utils import sanitize_title
 from namegnome.models.core import MediaFile, MediaType
 from namegnome.rules.base import RuleSet, RuleSetConfig
 
 if TYPE_CHECKING:
-    from namegnome.metadata.models import MediaMetadata
+    from namegnome.metadata.models import MediaMetadata, TVEpisode
+
+# Reason: filenames use dots and underscores as word separators; one C-level
+# translate pass replaces both before runs of whitespace are collapsed.
+_SEP_TRANS = str.maketrans({".": " ", "_": " "})
+
+# Reason: Only include extensions supported by Plex for video files. Built once
+# at import and shared by every PlexRuleSet instance.
+_VIDEO_EXTENSIONS: frozenset[str] = frozenset(
+    sys.intern(ext)
+    for ext in (
+        ".mp4",
+        ".mkv",
+        ".avi",
+        ".mov",
+        ".wmv",
+        ".m4v",
+        ".mpg",
+        ".mpeg",
+        ".flv",
+        ".webm",
+    )
+)
+
+
+def _clean_separators(text: str) -> str:
+    """Turn dot/underscore separators into single spaces and trim the result."""
+    return " ".join(text.translate(_SEP_TRANS).split())
+
+
+def _join_resolved(root_dir: Path, *parts: str) -> Path:
+    """Join path parts onto root_dir and resolve the result.
+
+    Reason: chained ``Path / part`` builds and re-parses an intermediate
+    PurePath per segment; os.path.join on strings allocates a single Path.
+    """
+    return Path(os.path.join(os.fspath(root_dir), *parts)).resolve()
+
+
+# Reason: the anthology splitter and planner resolve the same source file
+# several times (different spans/titles, fallbacks), so the pure filename
+# parsing is memoized. Only the filename-derived parts are cached; config,
+# metadata and MediaFile fields are still applied on every call. The compiled
+# pattern is part of the key so subclasses overriding it stay correct.
+@lru_cache(maxsize=65536)
+def _parse_tv_filename(
+    pattern: re.Pattern[str], filename: str, ext: str
+) -> tuple[str, int | str, int | str, str | None] | None:
+    """Parse show name, season, episode and episode title from a TV filename."""
+    match = pattern.match(filename)
+    if not match:
+        return None
+    season_str = match.group(2)
+    episode_str = match.group(3)
+    season_val: int | str = int(season_str) if season_str.isdigit() else season_str
+    episode_val: int | str = int(episode_str) if episode_str.isdigit() else episode_str
+    episode_title_raw = match.group(4).strip() if match.group(4) else ""
+    if episode_title_raw.endswith(ext):
+        episode_title_raw = episode_title_raw[: -len(ext)]
+    if not episode_title_raw or episode_title_raw.lower() == ext.lstrip(".").lower():
+        episode_title = None
+    else:
+        episode_title = _clean_separators(episode_title_raw)
+    return _clean_separators(match.group(1)), season_val, episode_val, episode_title
+
+
+@lru_cache(maxsize=65536)
+def _parse_movie_filename(
+    pattern: re.Pattern[str], filename: str
+) -> tuple[str, int] | None:
+    """Parse movie name and year from a filename ("Name (Year)" or "Name.Year")."""
+    match = pattern.match(filename)
+    if not match:
+        return None
+    if match["paren_year"] is not None:
+        title, year_str = match["paren_title"], match["paren_year"]
+    else:
+        title, year_str = match["dot_title"], match["dot_year"]
+    return _clean_separators(title), int(year_str)
+
+
+def index_episodes(metadata: "MediaMetadata") -> dict[tuple[int, int], "TVEpisode"]:
+    """Index the titled episodes of ``metadata`` by (season, episode).
+
+    Pass the result to :meth:`PlexRuleSet.target_path` as ``episode_index``
+    when naming many files against the same metadata, so each lookup is a dict
+    probe instead of a scan over every episode. The index is a snapshot; build
+    a new one after editing ``metadata.episodes``.
+    """
+    index: dict[tuple[int, int], "TVEpisode"] = {}
+    for ep in metadata.episodes:
+        if ep.title and ep.title.strip():
+            index.setdefault((ep.season_number, ep.episode_number), ep)
+    return index
+
+
+def _find_episode(
+    metadata: "MediaMetadata",
+    season_val: int | str,
+    episode_val: int | str,
+    episode_index: Mapping[tuple[int, int], "TVEpisode"] | None,
+) -> "TVEpisode | None":
+    """Return the first episode with a non-blank title at season/episode."""
+    if episode_index is not None:
+        return episode_index.get((season_val, episode_val))  # type: ignore[arg-type]
+    for ep in metadata.episodes:
+        if (
+            ep.season_number == season_val
+            and ep.episode_number == episode_val
+            and ep.title
+            and ep.title.strip()
+        ):
+            return ep
+    return None
 
 
 class PlexRuleSet(RuleSet):
@@ -58,24 +174,21 @@ class PlexRuleSet(RuleSet):
     year_pattern: ClassVar[re.Pattern[str]] = re.compile(
         r"(.*?)\.(\d{4})(?:\.(.+))?$", re.IGNORECASE
     )
+    # Reason: movie_pattern and year_pattern fused into one alternation so a
+    # filename without "(Year)" is classified in a single regex call. The
+    # parenthesised-year branch is tried first, preserving its precedence.
+    movie_name_pattern: ClassVar[re.Pattern[str]] = re.compile(
+        r"(?:(?P<paren_title>.*?)\s*\((?P<paren_year>\d{4})\)"
+        r"|(?P<dot_title>.*?)\.(?P<dot_year>\d{4}))(?:\.(?P<rest>.+))?$",
+        re.IGNORECASE,
+    )
 
     def __init__(self: Self) -> None:
         """Initialize the PlexRuleSet."""
         super().__init__("plex")
 
-        # Reason: Only include extensions supported by Plex for video files.
-        self.video_extensions = {
-            ".mp4",
-            ".mkv",
-            ".avi",
-            ".mov",
-            ".wmv",
-            ".m4v",
-            ".mpg",
-            ".mpeg",
-            ".flv",
-            ".webm",
-        }
+        # Shared module-level set; no per-instance allocation.
+        self.video_extensions = _VIDEO_EXTENSIONS
 
     def supports_media_type(self: Self, media_type: MediaType) -> bool:
         """Check if this rule set supports the given media type.
@@ -105,6 +218,7 @@ class PlexRuleSet(RuleSet):
         metadata: "MediaMetadata | None" = None,
         episode_span: Optional[str] = None,
         joined_titles: Optional[str] = None,
+        episode_index: Mapping[tuple[int, int], "TVEpisode"] | None = None,
         **kwargs: object,
     ) -> Path:
         """Generate a target path for a media file using Plex naming conventions.
@@ -118,6 +232,9 @@ class PlexRuleSet(RuleSet):
                 influence naming.
             episode_span: Optional episode span for output filename generation.
             joined_titles: Optional joined titles for output filename generation.
+            episode_index: Optional :func:`index_episodes` result for
+                ``metadata``, built once by callers that name many files
+                against the same metadata.
 
         Returns:
             A Path object representing the target location for this file.
@@ -130,29 +247,36 @@ class PlexRuleSet(RuleSet):
                 f"Media type {media_file.media_type} is not supported by Plex rule set"
             )
 
+        # Reason: each Path attribute access re-derives its value, so the ones
+        # the helpers need are read once here and passed down as plain values.
+        source = media_file.path
+        filename = source.name
+
         # Use base_dir or the parent of the original file
-        root_dir = base_dir if base_dir else media_file.path.parent
+        root_dir = base_dir if base_dir else source.parent
 
         # Use default config if none provided
         if config is None:
             config = RuleSetConfig()
 
         # Get the file extension
-        ext = media_file.path.suffix.lower()
+        ext = source.suffix.lower()
 
-        if media_file.media_type == MediaType.TV:
+        if media_file.media_type is MediaType.TV:
             return self._tv_show_path(
                 media_file,
+                filename,
                 root_dir,
                 ext,
                 config=config,
                 metadata=metadata,
                 episode_span=episode_span,
                 joined_titles=joined_titles,
+                episode_index=episode_index,
             )
-        elif media_file.media_type == MediaType.MOVIE:
+        elif media_file.media_type is MediaType.MOVIE:
             return self._movie_path(
-                media_file,
+                filename,
                 root_dir,
                 ext,
                 config=config,
@@ -165,12 +289,14 @@ class PlexRuleSet(RuleSet):
     def _tv_show_path(  # type: ignore  # noqa: C901, PLR0912, PLR0915
         self: Self,
         media_file: MediaFile,
+        filename: str,
         root_dir: Path,
         ext: str,
         config: Optional[RuleSetConfig] = None,
         metadata: "MediaMetadata | None" = None,
         episode_span: Optional[str] = None,
         joined_titles: Optional[str] = None,
+        episode_index: Mapping[tuple[int, int], "TVEpisode"] | None = None,
     ) -> Path:
         """Generate a target path for a TV show file.
 
@@ -180,32 +306,25 @@ class PlexRuleSet(RuleSet):
         """
         if config is None:
             config = RuleSetConfig()
-        filename = media_file.path.name
         # Prefer explicit metadata from MediaFile (for anthology/LLM splits)
         # Reason: episode 0 is no longer considered valid after stricter
         # normalisation (S00E00 rows are dropped).  We therefore only accept
         # real episode numbers ≥1.
         if media_file.title and media_file.episode is not None:
-            show_name = media_file.title.replace(".", " ").title()
+            show_name = _clean_separators(media_file.title).title()
             season_val = media_file.season if media_file.season is not None else 1
             # Use episode_span if provided (for spans), else media_file.episode
             episode_val = episode_span or media_file.episode or 1
-            episode_title = (
+            episode_title = _clean_separators(
                 joined_titles
                 or getattr(media_file, "episode_title", None)
                 or "Unknown Episode"
-            ).replace(".", " ")
+            )
             # Use metadata for episode title if available
             if metadata and metadata.episodes:
-                for ep in metadata.episodes:
-                    if (
-                        ep.season_number == season_val
-                        and ep.episode_number == episode_val
-                        and ep.title
-                        and ep.title.strip()
-                    ):
-                        episode_title = ep.title.strip().replace(".", " ")
-                        break
+                ep = _find_episode(metadata, season_val, episode_val, episode_index)
+                if ep is not None and ep.title:
+                    episode_title = _clean_separators(ep.title)
                 if not episode_title:
                     episode_title = "Unknown Episode"
             elif not episode_title:
@@ -228,16 +347,16 @@ class PlexRuleSet(RuleSet):
                     f"{show_name} - S{season_val:02d}E{episode_val:02d} - "
                     f"{sanitized_episode_title}{ext}"
                 )
-            return (
-                root_dir
-                / "TV Shows"
-                / show_name
-                / f"Season {int(season_val):02d}"
-                / filename
-            ).resolve()
+            return _join_resolved(
+                root_dir,
+                "TV Shows",
+                show_name,
+                f"Season {int(season_val):02d}",
+                filename,
+            )
         else:
-            match = self.tv_pattern.match(filename)
-            if not match:
+            parsed = _parse_tv_filename(self.tv_pattern, filename, ext)
+            if parsed is None:
                 show_name = (
                     config.show_name
                     or (metadata.title if metadata else None)
@@ -248,47 +367,22 @@ class PlexRuleSet(RuleSet):
                 episode_val = 1
                 episode_title = "Unknown Episode"
             else:
+                parsed_show, season_val, episode_val, episode_title = parsed
                 show_name = (
                     config.show_name
                     or (metadata.title if metadata else None)
-                    or match.group(1).strip().replace(".", " ")
+                    or parsed_show
                 )
                 show_name = show_name.title()
-                season_str = match.group(2)
-                episode_str = match.group(3)
-                if season_str.isdigit():
-                    season_val = int(season_str)
-                else:
-                    season_val = season_str
-                if episode_str.isdigit():
-                    episode_val = int(episode_str)
-                else:
-                    episode_val = episode_str
-                episode_title_raw = match.group(4).strip() if match.group(4) else ""
-                if episode_title_raw.endswith(ext):
-                    episode_title_raw = episode_title_raw[: -len(ext)]
-                if (
-                    not episode_title_raw
-                    or episode_title_raw.lower() == ext.lstrip(".").lower()
-                ):
-                    episode_title = None
-                else:
-                    episode_title = episode_title_raw.replace(".", " ").strip()
         # Use metadata for episode title if available
         if "season_val" not in locals():
             season_val = 1
         if "episode_val" not in locals():
             episode_val = 1
         if metadata and metadata.episodes:
-            for ep in metadata.episodes:
-                if (
-                    ep.season_number == season_val
-                    and ep.episode_number == episode_val
-                    and ep.title
-                    and ep.title.strip()
-                ):
-                    episode_title = ep.title.strip().replace(".", " ")
-                    break
+            ep = _find_episode(metadata, season_val, episode_val, episode_index)
+            if ep is not None and ep.title:
+                episode_title = _clean_separators(ep.title)
             if not episode_title:
                 episode_title = "Unknown Episode"
         elif not episode_title:
@@ -303,17 +397,17 @@ class PlexRuleSet(RuleSet):
             f"{show_name} - S{int(season_val):02d}E{str(episode_val).zfill(2)} - "
             f"{sanitized_episode_title}{ext}"
         )
-        return (
-            root_dir
-            / "TV Shows"
-            / show_name
-            / f"Season {int(season_val):02d}"
-            / filename
-        ).resolve()
+        return _join_resolved(
+            root_dir,
+            "TV Shows",
+            show_name,
+            f"Season {int(season_val):02d}",
+            filename,
+        )
 
     def _movie_path(
         self: Self,
-        media_file: MediaFile,
+        filename: str,
         root_dir: Path,
         ext: str,
         config: Optional[RuleSetConfig] = None,
@@ -324,7 +418,7 @@ class PlexRuleSet(RuleSet):
         Format: /Movies/Movie Name (Year)/Movie Name (Year).ext
 
         Args:
-            media_file: The media file to generate a target path for.
+            filename: Name of the source file (including its extension).
             root_dir: The base directory to build the path from.
             ext: The file extension.
             config: Optional configuration for the rule set.
@@ -337,34 +431,21 @@ class PlexRuleSet(RuleSet):
         if config is None:
             config = RuleSetConfig()
 
-        filename = media_file.path.name
-        match = self.movie_pattern.match(filename)
-        if match:
-            movie_name = match.group(1).strip().replace(".", " ")
-            year = int(match.group(2)) if match.group(2) else None
+        # Matches "Name (Year)" first, then the year pattern (The.Matrix.1999.mp4)
+        parsed = _parse_movie_filename(self.movie_name_pattern, filename)
+        if parsed is not None:
+            movie_name, year = parsed
         else:
-            # Try year pattern (e.g., The.Matrix.1999.mp4)
-            match_year = self.year_pattern.match(filename)
-            if match_year:
-                movie_name = match_year.group(1).strip().replace(".", " ")
-                year = int(match_year.group(2)) if match_year.group(2) else None
-            else:
-                movie_name = (
-                    metadata.title
-                    if metadata and metadata.title
-                    else (filename.rsplit(".", 1)[0].replace(".", " "))
-                )
-                year = None
+            movie_name = (
+                metadata.title
+                if metadata and metadata.title
+                else _clean_separators(filename.rsplit(".", 1)[0])
+            )
+            year = None
 
         # Prefer metadata year if available
         if metadata and metadata.year:
             year = metadata.year
 
-        if year:
-            movie_dir = root_dir / "Movies" / f"{movie_name} ({year})"
-            filename = f"{movie_name} ({year}){ext}"
-        else:
-            movie_dir = root_dir / "Movies" / movie_name
-            filename = f"{movie_name}{ext}"
-
-        return (movie_dir / filename).resolve()
+        movie_dir = f"{movie_name} ({year})" if year else movie_name
+        return _join_resolved(root_dir, "Movies", movie_dir, f"{movie_dir}{ext}")
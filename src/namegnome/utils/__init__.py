@@ -1,13 +1,17 @@
 """Utility modules for namegnome."""
 
-from namegnome.utils.hash import sha256sum
-from namegnome.utils.json import DateTimeEncoder
-from namegnome.utils.plan_store import (
-    get_plan_metadata,
-    list_plans,
-    load_plan,
-    save_plan,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from namegnome.utils.hash import sha256sum
+    from namegnome.utils.json import DateTimeEncoder
+    from namegnome.utils.plan_store import (
+        get_plan_metadata,
+        list_plans,
+        load_plan,
+        save_plan,
+    )
 
 __all__ = [
     "sha256sum",
@@ -17,3 +21,26 @@ __all__ = [
     "list_plans",
     "get_plan_metadata",
 ]
+
+# Reason: the CLI's global callback imports namegnome.utils.config on every
+# invocation (including --help and version); resolving these re-exports lazily
+# keeps that from loading plan_store and with it pydantic, yaml and the models.
+_LAZY_EXPORTS: dict[str, str] = {
+    "sha256sum": "namegnome.utils.hash",
+    "DateTimeEncoder": "namegnome.utils.json",
+    "save_plan": "namegnome.utils.plan_store",
+    "load_plan": "namegnome.utils.plan_store",
+    "list_plans": "namegnome.utils.plan_store",
+    "get_plan_metadata": "namegnome.utils.plan_store",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a re-exported helper on first access (PEP 562)."""
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -1,6 +1,7 @@
 """Unit tests for small helper functions in namegnome.cli.commands."""
 
 import asyncio
+import dataclasses
 from pathlib import Path
 
 import pytest
@@ -40,3 +41,59 @@ def test_convert_to_model_options(tmp_path):
     assert model_opts.root == tmp_path
     assert model_opts.platform == "plex"
     assert model_opts.media_types == media_types
+
+
+def test_validate_media_type_case_insensitive_and_rejects_unknown_values():
+    import typer
+
+    assert cmd.validate_media_type("TV") is MediaType.TV
+    assert cmd.validate_media_type("movie") is MediaType.MOVIE
+    with pytest.raises(typer.BadParameter, match="Must be one of: tv, movie, music"):
+        cmd.validate_media_type("podcast")
+
+
+def test_validate_media_types_drops_repeats():
+    assert cmd._validate_media_types(["tv", "TV", "movie", "tv"]) == [
+        MediaType.TV,
+        MediaType.MOVIE,
+    ]
+
+
+def test_rule_set_and_config_are_memoized():
+    """Repeated scans with the same options reuse the rule set and config."""
+    args = (None, None, False, False, False, "llama3:8b", True, False, None)
+
+    assert cmd._get_rule_set("plex") is cmd._get_rule_set("plex")
+    config = cmd._build_rule_set_config(*args)
+    assert config is cmd._build_rule_set_config(*args)
+    assert config.llm_model == "llama3:8b"
+    assert cmd._build_rule_set_config(*args[:-1], 30).max_duration == 30
+    # The shared config is frozen, so one scan cannot change it for the next.
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.anthology = True  # type: ignore[misc]
+
+
+def test_validate_media_types_reports_every_invalid_value():
+    import typer
+
+    with pytest.raises(typer.BadParameter) as excinfo:
+        cmd._validate_media_types(["tv", "podcast", "Podcast", "audiobook"])
+    message = str(excinfo.value)
+    assert "Must be one of: tv, movie, music" in message
+    assert message.endswith("(got: podcast, audiobook)")
+
+
+def test_validate_media_types_reports_values_as_typed():
+    import typer
+
+    with pytest.raises(typer.BadParameter) as excinfo:
+        cmd._validate_media_types(["PodCast", "podcast", "TV"])
+    assert str(excinfo.value).endswith("(got: PodCast)")
+
+
+def test_click_command_is_built_once_for_app_main():
+    import namegnome.cli as cli
+
+    first = cli._get_click_command()
+    assert cli._get_click_command() is first
+    assert "scan" in first.commands
@@ -110,3 +110,168 @@ def test_download_artwork_for_movies_creates_poster(tmp_path, monkeypatch):
 
     poster = tmp_path / ".namegnome" / "artwork" / "12345" / "poster.jpg"
     assert poster.exists() and poster.read_bytes()
+
+
+def test_download_artwork_for_movies_fetches_concurrently(tmp_path, monkeypatch):
+    """Artwork fetches for several movies overlap instead of running serially."""
+    import asyncio
+
+    in_flight = 0
+    peak = 0
+
+    async def _fake_fetch(meta, artwork_dir: Path):  # noqa: ANN001
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    monkeypatch.setattr(cmd, "fetch_fanart_poster", _fake_fetch, raising=True)
+
+    files = []
+    for i in range(3):
+        movie_path = tmp_path / f"movie{i}.mp4"
+        movie_path.write_bytes(b"data")
+        files.append(
+            MediaFile(
+                path=movie_path.resolve(),
+                size=4,
+                media_type=MediaType.MOVIE,
+                modified_date=_dt.datetime.now(),
+            )
+        )
+    scan_result = ScanResult(
+        files=files,
+        root_dir=tmp_path,
+        media_types=[MediaType.MOVIE],
+        platform="plex",
+    )
+
+    cmd._download_artwork_for_movies(scan_result, tmp_path)
+
+    assert peak == 3
+    assert (tmp_path / ".namegnome" / "artwork" / "12345" / "poster.jpg").exists()
+
+
+def test_emit_plan_json_output_writes_file_and_stdout(tmp_path, capsys):
+    """--json with --output writes the same JSON document to disk and stdout."""
+    import json
+
+    from namegnome.models.plan import RenamePlan
+
+    plan = RenamePlan(
+        id="plan-1",
+        created_at=_dt.datetime(2024, 1, 2, 3, 4, 5),
+        root_dir=tmp_path,
+        items=[],
+        platform="plex",
+        media_types=[MediaType.MOVIE],
+    )
+    options = cmd.ScanCommandOptions(root=tmp_path, json_output=True)
+    output = tmp_path / "out" / "plan.json"
+
+    assert cmd._emit_plan(plan, options, output) == cmd.ExitCode.SUCCESS
+
+    stdout = capsys.readouterr().out
+    assert output.read_text(encoding="utf-8") == stdout
+    data = json.loads(stdout)
+    assert data["id"] == "plan-1"
+    assert data["created_at"] == "2024-01-02T03:04:05"
+    assert data["root_dir"] == str(tmp_path)
+
+
+def test_build_plan_skips_progress_when_not_interactive(tmp_path, monkeypatch):
+    """No Rich progress bar is built for JSON output or non-terminal consoles."""
+
+    def _fail() -> None:
+        raise AssertionError("progress bar should not be created")
+
+    monkeypatch.setattr(cmd, "create_default_progress", _fail, raising=False)
+    monkeypatch.setattr(
+        cmd,
+        "scan_directory",
+        lambda root, media_types, options: ScanResult(
+            files=[], root_dir=root, media_types=media_types, platform="plex"
+        ),
+        raising=False,
+    )
+    options = cmd.ScanCommandOptions(root=tmp_path, json_output=True)
+
+    assert cmd._build_plan(options, [MediaType.MOVIE]) is None
+
+
+def test_json_mode_routes_messages_to_stderr(tmp_path, monkeypatch, capsys):
+    """In --json mode status messages go to stderr, keeping stdout parseable."""
+    monkeypatch.setattr(
+        cmd,
+        "scan_directory",
+        lambda root, media_types, options: ScanResult(
+            files=[], root_dir=root, media_types=media_types, platform="plex"
+        ),
+        raising=False,
+    )
+    options = cmd.ScanCommandOptions(
+        root=tmp_path, media_type=["movie"], json_output=True, no_color=True
+    )
+
+    assert cmd._run_scan(options) == cmd.ExitCode.ERROR
+
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "No media files found." in captured.err
+
+
+def _stub_plan(tmp_path):
+    from namegnome.models.plan import RenamePlan
+
+    return RenamePlan(
+        id="plan-1",
+        root_dir=tmp_path,
+        items=[],
+        platform="plex",
+        media_types=[MediaType.MOVIE],
+    )
+
+
+def test_run_scan_stores_plan_before_emitting(tmp_path, monkeypatch):
+    """The plan is stored before the diff or JSON is emitted."""
+    plan = _stub_plan(tmp_path)
+    events: List[str] = []
+
+    def _save(plan_arg, scan_options, extra_args=None):
+        events.append("save")
+        return "stored-id"
+
+    def _emit(*args, **kwargs):
+        events.append("emit")
+        return cmd.ExitCode.SUCCESS
+
+    monkeypatch.setattr(cmd, "_build_plan", lambda options, media_types: (plan, None))
+    monkeypatch.setattr(cmd, "save_plan", _save, raising=False)
+    monkeypatch.setattr(cmd, "_emit_plan", _emit)
+    options = cmd.ScanCommandOptions(root=tmp_path, media_type=["movie"], no_color=True)
+
+    assert cmd._run_scan(options) == cmd.ExitCode.SUCCESS
+    assert events == ["save", "emit"]
+
+
+def test_run_scan_json_emits_nothing_when_store_fails(tmp_path, monkeypatch, capsys):
+    """A failed store under --json leaves stdout and --output empty."""
+    plan = _stub_plan(tmp_path)
+
+    def _save(plan_arg, scan_options, extra_args=None):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(cmd, "_build_plan", lambda options, media_types: (plan, None))
+    monkeypatch.setattr(cmd, "save_plan", _save, raising=False)
+    options = cmd.ScanCommandOptions(
+        root=tmp_path, media_type=["movie"], json_output=True, no_color=True
+    )
+    output = tmp_path / "plan.json"
+
+    assert cmd._run_scan(options, output) == cmd.ExitCode.ERROR
+
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "disk full" in captured.err
+    assert not output.exists()
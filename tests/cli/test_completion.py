@@ -16,3 +16,26 @@ def test_completion_command_bash():  # noqa: D103
     assert result.exit_code == 0, result.output
     out = _clean(result.output)
     assert "_NAMEGNOME_COMPLETE" in out or "namegnome" in out.lower()
+
+
+def test_plan_id_autocomplete_lists_matching_plan_files(tmp_path, monkeypatch):  # noqa: D103
+    import os
+
+    from namegnome.cli.commands import plan_id_autocomplete
+    from namegnome.utils.plan_store import _ensure_plan_dir
+
+    monkeypatch.setenv("HOME", str(tmp_path))
+    plans_dir = _ensure_plan_dir()
+    names = ("abc1.json", "abc2.json", "abc1.meta.yaml", "xyz.json", "latest.json")
+    for age, name in enumerate(names):
+        path = plans_dir / name
+        path.write_text("{}")
+        # Later names in the tuple are older, so abc1 is the newest plan.
+        os.utime(path, (1_000_000 - age, 1_000_000 - age))
+
+    assert plan_id_autocomplete(None, [], "abc") == ["abc1", "abc2"]  # type: ignore[arg-type]
+    assert plan_id_autocomplete(None, [], "") == ["abc1", "abc2", "xyz"]  # type: ignore[arg-type]
+
+    # Newest first, as list_plans() orders them.
+    os.utime(plans_dir / "xyz.json", (2_000_000, 2_000_000))
+    assert plan_id_autocomplete(None, [], "") == ["xyz", "abc1", "abc2"]  # type: ignore[arg-type]
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from rich.console import Console
 
-from namegnome.cli.console import ConsoleManager
+from namegnome.cli.console import BufferedLog, ConsoleManager
 
 
 def _get_output(capsys) -> str:
@@ -38,3 +38,92 @@ def test_console_manager_pretty_traceback():  # noqa: D103
 
     # Rich pretty-traceback should contain exception class name.
     assert "ZeroDivisionError" in output
+
+
+def test_install_rich_traceback_is_opt_in(monkeypatch):  # noqa: D103
+    import rich.traceback
+
+    import namegnome.cli as cli
+
+    calls: list[dict] = []
+    monkeypatch.setattr(rich.traceback, "install", lambda **kw: calls.append(kw))
+    monkeypatch.setattr(cli, "_rich_traceback_installed", False)
+
+    monkeypatch.delenv("NAMEGNOME_RICH_TRACEBACK", raising=False)
+    cli.install_rich_traceback()
+    assert calls == []
+
+    monkeypatch.setenv("NAMEGNOME_RICH_TRACEBACK", "1")
+    monkeypatch.delenv("NAMEGNOME_DEBUG", raising=False)
+    cli.install_rich_traceback()
+    cli.install_rich_traceback()
+    assert len(calls) == 1
+    assert calls[0]["show_locals"] is False
+
+
+def test_buffered_log_batches_lines():  # noqa: D103
+    console = Console(record=True, width=200)
+    calls: list[str] = []
+    original_log = console.log
+    console.log = lambda msg: (calls.append(msg), original_log(msg))  # type: ignore[method-assign]
+
+    with BufferedLog(console, flush_every=2) as log:
+        for i in range(5):
+            log.write(f"line {i}")
+
+    assert calls == ["line 0\nline 1", "line 2\nline 3", "line 4"]
+    assert "line 4" in console.export_text()
+
+
+def test_no_rich_flag_sets_module_state_not_env(monkeypatch):  # noqa: D103
+    import os
+
+    from typer.testing import CliRunner
+
+    from namegnome.cli import _state, app
+
+    monkeypatch.setattr(_state, "NO_RICH", False)
+    monkeypatch.delenv("NAMEGNOME_NO_RICH", raising=False)
+
+    result = CliRunner().invoke(app, ["--no-rich", "version"])
+
+    assert result.exit_code == 0
+    assert _state.NO_RICH is True
+    assert "NAMEGNOME_NO_RICH" not in os.environ
+    with ConsoleManager() as console:
+        assert console.color_system is None
+
+
+def test_console_manager_installs_traceback_once(monkeypatch):  # noqa: D103
+    import importlib
+
+    import rich.traceback
+
+    # namegnome.cli re-exports the Console instance under the submodule's name.
+    console_mod = importlib.import_module("namegnome.cli.console")
+
+    calls: list[dict] = []
+    monkeypatch.setattr(rich.traceback, "install", lambda **kw: calls.append(kw))
+    monkeypatch.setattr(console_mod, "_traceback_installed", False)
+
+    with ConsoleManager(record=True):
+        with ConsoleManager(record=True):
+            pass
+    with ConsoleManager(record=True):
+        pass
+
+    assert len(calls) == 1
+
+
+def test_rich_disabled_reads_env_var_once(monkeypatch):  # noqa: D103
+    from namegnome.cli import _state
+
+    monkeypatch.setattr(_state, "NO_RICH", False)
+    monkeypatch.setenv("NAMEGNOME_NO_RICH", "yes")
+    _state._env_no_rich.cache_clear()
+    try:
+        assert _state.rich_disabled() is True
+        monkeypatch.setenv("NAMEGNOME_NO_RICH", "0")
+        assert _state.rich_disabled() is True
+    finally:
+        _state._env_no_rich.cache_clear()
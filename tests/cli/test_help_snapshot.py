@@ -1,4 +1,6 @@
 import re
+import subprocess
+import sys
 
 import pytest
 from typer.testing import CliRunner
@@ -59,3 +61,41 @@ def test_help_contains_keywords(case: str) -> None:  # noqa: D103
     output = _clean(result.output)
     missing: list[str] = [kw for kw in keywords if kw not in output]
     assert not missing, f"Help output missing expected keywords: {missing}"
+
+
+@pytest.mark.parametrize(
+    "args",
+    [["--help"], ["version"], ["llm", "--help"], ["config", "--help"]],
+)
+def test_light_commands_do_not_import_core_modules(args: list[str]) -> None:
+    """Help and version should not load core modules, pydantic or rich.progress."""
+    code = (
+        "import sys\n"
+        "from typer.testing import CliRunner\n"
+        "from namegnome.cli.commands import app\n"
+        f"assert CliRunner().invoke(app, {args!r}).exit_code == 0\n"
+        "heavy = [m for m in sys.modules if m in ('pydantic', 'rich.progress')\n"
+        "    or m.startswith(\n"
+        "    ('namegnome.core', 'namegnome.metadata', 'namegnome.llm'))]\n"
+        "print(heavy)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_version_entry_point_skips_typer() -> None:
+    """``python -m namegnome version`` answers without importing Typer."""
+    code = (
+        "import runpy, sys\n"
+        "sys.argv = ['namegnome', 'version']\n"
+        "runpy.run_module('namegnome', run_name='__main__')\n"
+        "print('typer' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    lines = result.stdout.splitlines()
+    assert lines[0].startswith("NameGnome version: ")
+    assert lines[-1] == "False"
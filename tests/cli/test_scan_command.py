@@ -149,18 +149,6 @@ def mock_stdout_write() -> Generator[MagicMock, None, None]:
         yield mock_write
 
 
-@pytest.fixture
-def mock_validate_media_type() -> Generator[MagicMock, None, None]:
-    """Mock the validate_media_type function."""
-    with patch("namegnome.cli.commands.validate_media_type") as mock_validate:
-        mock_validate.side_effect = (
-            lambda x: MediaType(x.lower())
-            if x.lower() in [m.value for m in MediaType]
-            else typer.BadParameter(f"Invalid media type: {x}")
-        )
-        yield mock_validate
-
-
 @pytest.fixture
 def temp_dir_with_media() -> Generator[Path, None, None]:
     """Create a temporary directory with a fake media file."""
@@ -313,7 +301,7 @@ def test_scan_command_exit_code_manual(tmp_path: Path) -> None:
     runner = CliRunner()
     with (
         patch("namegnome.cli.commands.create_rename_plan", return_value=plan),
-        patch("namegnome.cli.commands.Progress", MagicMock()),
+        patch("namegnome.cli.commands.create_default_progress", MagicMock()),
         patch("namegnome.cli.commands.console.status", MagicMock()),
     ):
         result = runner.invoke(
@@ -339,7 +327,7 @@ def test_scan_command_manual_message(tmp_path: Path) -> None:
     runner = CliRunner()
     with (
         patch("namegnome.cli.commands.create_rename_plan", return_value=plan),
-        patch("namegnome.cli.commands.Progress", MagicMock()),
+        patch("namegnome.cli.commands.create_default_progress", MagicMock()),
         patch("namegnome.cli.commands.console.status", MagicMock()),
     ):
         result = runner.invoke(
@@ -62,3 +62,10 @@ def test_progress_includes_filename_column():  # noqa: D401
     assert len(column_types) >= 5
     # Spinner is still first
     assert column_types[0] == "SpinnerColumn"
+
+
+def test_progress_is_disabled_without_terminal():  # noqa: D401
+    # Under pytest stdout is captured, so the global console is not a terminal
+    progress = create_default_progress()
+    assert progress.disable
+    assert progress.live.transient
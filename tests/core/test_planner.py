@@ -30,7 +30,7 @@ from namegnome.core.tv.plan_orchestration import (
 from namegnome.core.tv.segment_splitter import _detect_delimiter, _find_candidate_splits
 from namegnome.core.tv.utils import normalize_episode_list
 from namegnome.models.core import MediaFile, MediaType, PlanStatus, ScanResult
-from namegnome.models.plan import RenamePlan
+from namegnome.models.plan import RenamePlan, RenamePlanItem
 from namegnome.rules.base import RuleSetConfig
 from namegnome.rules.plex import PlexRuleSet
 from namegnome.core.tv.tv_rule_config import TVRuleSetConfig
@@ -935,6 +935,50 @@ class TestCreateRenamePlan:
         conflict_statuses = [item.status == PlanStatus.CONFLICT for item in plan.items]
         assert any(conflict_statuses)
 
+    def test_movie_conflicts_share_reason(self, temp_dir: Path) -> None:
+        """Every item in a colliding group is marked CONFLICT with a reason."""
+        media_files = []
+        for sub in ("a", "b"):
+            (temp_dir / sub).mkdir()
+            path = temp_dir / sub / "Movie (2020).mkv"
+            path.write_bytes(b"dummy content")
+            media_files.append(
+                MediaFile(
+                    path=path.absolute(),
+                    size=13,
+                    media_type=MediaType.MOVIE,
+                    modified_date=datetime.now(),
+                    title="Movie",
+                    year=2020,
+                )
+            )
+        scan_result = ScanResult(
+            files=media_files,
+            root_dir=temp_dir.absolute(),
+            media_types=[MediaType.MOVIE],
+            platform="plex",
+            total_files=2,
+            skipped_files=0,
+            by_media_type={MediaType.MOVIE: 2},
+            scan_duration_seconds=0.1,
+        )
+
+        plan = create_rename_plan(
+            RenamePlanBuildContext(
+                scan_result=scan_result,
+                rule_set=PlexRuleSet(),
+                plan_id="test-plan",
+                platform="plex",
+            )
+        )
+
+        assert [item.status for item in plan.items] == [PlanStatus.CONFLICT] * 2
+        assert all(
+            item.reason
+            and item.reason.startswith("Destination collides with 1 other file: ")
+            for item in plan.items
+        )
+
 
 class TestSavePlan:
     """Tests for saving and loading plans to/from disk."""
@@ -963,6 +1007,36 @@ class TestSavePlan:
             data = json.load(f)
         assert data["id"] == "pid"
 
+    def test_save_plan_with_items(self, tmp_path: Path) -> None:
+        """Test that item paths and dates are written as plain JSON strings."""
+        source = tmp_path / "a.mp4"
+        media_file = MediaFile(
+            path=source,
+            size=1,
+            media_type=MediaType.MOVIE,
+            modified_date=datetime(2020, 1, 2, 3, 4, 5),
+        )
+        plan = RenamePlan(
+            id="pid",
+            items=[
+                RenamePlanItem(
+                    source=source,
+                    destination=tmp_path / "b.mp4",
+                    media_file=media_file,
+                )
+            ],
+            platform="plex",
+            root_dir=tmp_path,
+        )
+        output_path = planner.save_plan(plan, tmp_path)
+        with open(output_path) as f:
+            data = json.load(f)
+        item = data["items"][0]
+        assert data["root_dir"] == str(tmp_path)
+        assert item["destination"] == str(tmp_path / "b.mp4")
+        assert item["media_file"]["path"] == str(source)
+        assert item["media_file"]["modified_date"] == "2020-01-02T03:04:05"
+
     def test_save_plan_write_error(self, tmp_path: Path) -> None:
         """Test that save_plan raises an error if the file cannot be written."""
         plan = RenamePlan(
@@ -12,13 +12,20 @@ Rationale:
 """
 
 import logging
+import os
 import shutil
+import subprocess
+import sys
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Generator
+from typing import Any, Generator
 
 import pytest
 
+from namegnome.core import scanner
 from namegnome.core.scanner import ScanOptions, guess_media_type, scan_directory
 from namegnome.models.core import MediaType
 
@@ -67,6 +74,34 @@ class TestGuessMediaType:
         # Music in Music directory
         assert guess_media_type(tmp_path / "Music/song.mp3") == MediaType.MUSIC
 
+    def test_audio_extension_is_music(self, tmp_path: Path) -> None:
+        """Test that audio-only extensions are classified as music directly.
+
+        Scenarios:
+        - A year in the album folder or a misleading parent directory must not
+          turn an audio file into a movie.
+        """
+        assert (
+            guess_media_type(tmp_path / "Music/Artist (2010)/01 - Song.mp3")
+            == MediaType.MUSIC
+        )
+        assert guess_media_type(tmp_path / "Movies/score.flac") == MediaType.MUSIC
+
+    def test_file_name_patterns_take_precedence(self, tmp_path: Path) -> None:
+        """Test that the file name is classified before its folders.
+
+        Scenarios:
+        - An episode marker in the name wins over a year in the show folder.
+        - A bare name still falls back to patterns in its folders.
+        """
+        assert (
+            guess_media_type(tmp_path / "Show (2019)/Show S01E01.mkv") == MediaType.TV
+        )
+        assert (
+            guess_media_type(tmp_path / "Inception (2010)/movie.mkv") == MediaType.MOVIE
+        )
+        assert guess_media_type(tmp_path / "Show/Season 1/pilot.mkv") == MediaType.TV
+
     def test_unknown_type(self, tmp_path: Path) -> None:
         """Test that unknown media types are classified as UNKNOWN.
 
@@ -177,6 +212,75 @@ class TestScanDirectory:
         assert MediaType.MOVIE in result.by_media_type
         assert MediaType.MUSIC in result.by_media_type
 
+    def test_scan_counts_nested_files(self, temp_media_dir: Path) -> None:
+        """Test that file counters include files found in subdirectories.
+
+        Scenario:
+        - Media and non-media files live several levels below the root.
+        - total_files and skipped_files must aggregate across the whole tree,
+          not only the root directory.
+        """
+        result = scan_directory(temp_media_dir)
+
+        # 12 visible files in total; the hidden directory is never entered
+        assert result.total_files == 12
+        assert result.skipped_files == 4
+
+    def test_parallel_walk_keeps_depth_first_order(self, tmp_path: Path) -> None:
+        """Test that listing directories in parallel keeps sequential order.
+
+        Scenario:
+        - A single show folder holds several seasons, so every directory is
+          queued as its own task below one top-level folder.
+        - Files come back in the order of a plain depth-first os.scandir walk.
+        """
+        import os
+
+        for season in range(1, 6):
+            season_dir = tmp_path / "Show" / f"Season {season}"
+            season_dir.mkdir(parents=True)
+            for episode in range(1, 4):
+                name = f"Show S{season:02d}E{episode:02d}.mkv"
+                (season_dir / name).write_bytes(b"x")
+
+        def _walk(directory: str) -> list[str]:
+            paths: list[str] = []
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        paths.extend(_walk(entry.path))
+                    else:
+                        paths.append(entry.path)
+            return paths
+
+        result = scan_directory(tmp_path, media_types=[MediaType.TV])
+
+        assert [str(f.path) for f in result.files] == _walk(str(tmp_path))
+        assert result.total_files == 15
+
+    def test_scan_prunes_system_directories(self, tmp_path: Path) -> None:
+        """Test that OS/NAS metadata directories are never walked.
+
+        Scenario:
+        - Synology @eaDir and macOS __MACOSX folders contain media-looking
+          files, at the root and nested inside a show folder.
+        - Only the real episode is found, even with hidden entries included.
+        """
+        show_dir = tmp_path / "Show"
+        (show_dir / "@eaDir").mkdir(parents=True)
+        (tmp_path / "__MACOSX").mkdir()
+        (tmp_path / "Other").mkdir()
+        (show_dir / "Show S01E01.mkv").write_bytes(b"x")
+        (show_dir / "@eaDir" / "Show S01E01.mkv").write_bytes(b"x")
+        (tmp_path / "__MACOSX" / "Show S01E02.mkv").write_bytes(b"x")
+
+        result = scan_directory(
+            tmp_path, options=ScanOptions(recursive=True, include_hidden=True)
+        )
+
+        assert [f.path.name for f in result.files] == ["Show S01E01.mkv"]
+        assert result.total_files == 1
+
     def test_scan_specific_media_type(self, temp_media_dir: Path) -> None:
         """Test scanning for a specific media type.
 
@@ -269,3 +373,138 @@ class TestScanDirectory:
         # Check if any file ends with our target filename
         found = any(str(f.path).endswith("测试影片 (2024).mp4") for f in result.files)
         assert found, "Non-ASCII filename was not found in scan results"
+
+    def test_scan_with_stat_prefetch(self, temp_media_dir: Path) -> None:
+        """Test that prefetching stat() calls does not change the result.
+
+        Scenario:
+        - The same tree is scanned with prefetching off and with a window of 4.
+        - Files, counters and order are identical.
+        """
+        plain = scan_directory(temp_media_dir)
+        prefetched = scan_directory(
+            temp_media_dir, options=ScanOptions(prefetch_depth=4)
+        )
+
+        assert [f.path for f in prefetched.files] == [f.path for f in plain.files]
+        assert prefetched.total_files == plain.total_files
+        assert prefetched.skipped_files == plain.skipped_files
+
+    @pytest.mark.skipif(
+        not scanner.__file__.endswith(".py"),
+        reason="methods of the mypyc-compiled scanner cannot be patched",
+    )
+    def test_stat_prefetch_runs_ahead_for_visible_media_only(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the prefetcher is fed only entries the walk will stat().
+
+        Scenario:
+        - A directory holds media files, a hidden media file and a non-media file.
+        - Prefetch submissions are recorded.
+        - The first candidate is left to the scanner, every other visible
+          media file is prefetched, and nothing else is.
+        """
+        names = [f"Movie {i} (2020).mkv" for i in range(5)]
+        for name in names + [".hidden (2020).mkv", "notes.txt"]:
+            (tmp_path / name).write_bytes(b"x")
+        submitted: list[str] = []
+        original_submit = scanner._StatPrefetcher.submit
+
+        def _record(self: scanner._StatPrefetcher, path: str) -> bool:
+            accepted = original_submit(self, path)
+            if accepted:
+                submitted.append(Path(path).name)
+            return accepted
+
+        monkeypatch.setattr(scanner._StatPrefetcher, "submit", _record)
+        scan_directory(
+            tmp_path,
+            [MediaType.MOVIE],
+            options=ScanOptions(recursive=False, prefetch_depth=8),
+        )
+
+        # The scanner walks in os.scandir order, which is not sorted.
+        order = [e.name for e in os.scandir(tmp_path) if e.name in names]
+        assert sorted(submitted) == sorted(order[1:])
+
+    @pytest.mark.skipif(
+        not scanner.__file__.endswith(".py"),
+        reason="globals of the mypyc-compiled scanner cannot be patched",
+    )
+    def test_scan_tree_reports_failed_submit(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a directory task that cannot be queued fails the scan.
+
+        Scenario:
+        - The root directory has a subdirectory.
+        - Queuing the subdirectory's task raises.
+        - The walk raises that error instead of waiting forever.
+        """
+        (tmp_path / "sub").mkdir()
+
+        class _RefusingExecutor(ThreadPoolExecutor):
+            submitted = 0
+
+            def submit(self, *args: Any, **kwargs: Any) -> Any:
+                type(self).submitted += 1
+                if type(self).submitted > 1:
+                    raise RuntimeError("cannot schedule new futures")
+                return super().submit(*args, **kwargs)
+
+        monkeypatch.setattr(scanner, "ThreadPoolExecutor", _RefusingExecutor)
+        outcome: list[BaseException] = []
+
+        def _walk() -> None:
+            try:
+                scanner._scan_tree(str(tmp_path), ScanOptions())
+            except BaseException as e:
+                outcome.append(e)
+
+        walker = threading.Thread(target=_walk, daemon=True)
+        walker.start()
+        walker.join(5)
+        assert not walker.is_alive()
+        assert len(outcome) == 1
+        assert isinstance(outcome[0], RuntimeError)
+
+    def test_stat_prefetcher_caps_in_flight_stats(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that at most prefetch_depth stat() calls are in flight."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def _slow_stat(path: str) -> None:
+            started.set()
+            release.wait(5)
+
+        monkeypatch.setattr(scanner.os, "stat", _slow_stat)
+        prefetcher = scanner._StatPrefetcher(1)
+        try:
+            assert prefetcher.submit("a") is True
+            assert started.wait(5)
+            assert prefetcher.submit("b") is False
+            release.set()
+            deadline = time.monotonic() + 5
+            while not prefetcher.submit("c"):
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+        finally:
+            release.set()
+            prefetcher.shutdown()
+
+
+def test_core_package_loads_scanner_lazily() -> None:
+    """Importing namegnome.core defers the scanner until a re-export is used."""
+    code = (
+        "import sys\n"
+        "import namegnome.core as core\n"
+        "print('namegnome.core.scanner' in sys.modules)\n"
+        "print(core.scan_directory.__module__)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ["False", "namegnome.core.scanner"]
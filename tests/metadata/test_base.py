@@ -4,6 +4,8 @@ Covers expected usage, edge cases, and failure modes for the abstract
 metadata provider interface. See TASK.md Sprint 2.1 and PLANNING.md.
 """
 
+import asyncio
+
 import pytest
 
 from namegnome.metadata.base import MetadataClient
@@ -83,3 +85,24 @@ def test_failure_not_implemented() -> None:
 
     with pytest.raises(TypeError):
         IncompleteClient()  # type: ignore[abstract]
+
+
+@pytest.mark.asyncio
+async def test_details_bulk_preserves_order_and_bounds_concurrency() -> None:
+    """details_bulk returns results in input order with bounded concurrency."""
+    in_flight = 0
+    peak = 0
+
+    class SlowClient(DummyClient):
+        async def details(self, provider_id: str) -> MediaMetadata:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return await super().details(provider_id)
+
+    ids = [str(i) for i in range(10)]
+    results = await SlowClient().details_bulk(ids, max_concurrency=3)
+    assert [r.provider_id for r in results] == ids
+    assert peak == 3
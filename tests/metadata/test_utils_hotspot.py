@@ -33,3 +33,45 @@ def test_load_fixture_not_found(tmp_path, monkeypatch):
     monkeypatch.setattr(mu.Path, "exists", lambda self: False)
     with pytest.raises(FileNotFoundError):
         mu.load_fixture("tvdb", "nonexistent_file")
+
+
+def test_load_fixture_is_cached(tmp_path, monkeypatch):
+    """load_fixture should read and decode each fixture only once."""
+    fixture = tmp_path / "tests" / "fixtures" / "stubs" / "tvdb" / "search.json"
+    fixture.parent.mkdir(parents=True)
+    fixture.write_text('{"data": []}', encoding="utf-8")
+    # load_fixture resolves fixtures relative to parents[3] of its module file
+    monkeypatch.setattr(mu, "__file__", str(tmp_path / "src" / "pkg" / "m" / "u.py"))
+    mu.load_fixture.cache_clear()
+    try:
+        first = mu.load_fixture("tvdb", "search")
+        fixture.write_text('{"data": [1]}', encoding="utf-8")
+        assert mu.load_fixture("tvdb", "search") is first
+        assert first == {"data": []}
+    finally:
+        mu.load_fixture.cache_clear()
+
+
+def test_load_fixture_missing_name_uses_directory_index(tmp_path, monkeypatch):
+    """A missing fixture is a lookup miss in the listed provider directory."""
+    fixture = tmp_path / "tests" / "fixtures" / "stubs" / "tvdb" / "search.json"
+    fixture.parent.mkdir(parents=True)
+    fixture.write_text("{}", encoding="utf-8")
+    monkeypatch.setattr(mu, "__file__", str(tmp_path / "src" / "pkg" / "m" / "u.py"))
+    mu.load_fixture.cache_clear()
+    try:
+        assert mu.load_fixture("tvdb", "search") == {}
+        # Reason: absent names are not probed on disk once the directory is indexed
+        monkeypatch.setattr(mu.Path, "exists", lambda self: pytest.fail("probed"))
+        with pytest.raises(FileNotFoundError, match="other.json"):
+            mu.load_fixture("tvdb", "other")
+    finally:
+        mu.load_fixture.cache_clear()
+
+
+def test_extract_year():
+    assert mu.extract_year("2009-04-09") == 2009
+    assert mu.extract_year("1999") == 1999
+    assert mu.extract_year("") is None
+    assert mu.extract_year(None) is None
+    assert mu.extract_year("n/a") is None
@@ -1,6 +1,7 @@
 """Tests for the core models module."""
 
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 
@@ -108,6 +109,23 @@ class TestMediaFile:
         assert reconstructed.hash == original.hash
         assert reconstructed.metadata_ids == original.metadata_ids
 
+    def test_modified_date_from_timestamp(self, tmp_path: Path) -> None:
+        """Test that modified_date is derived from the stored timestamp."""
+        modified = datetime(2020, 1, 2, 3, 4, 5, 678901)
+        media_file = MediaFile(
+            path=tmp_path / "test.mp4",
+            size=1024,
+            media_type=MediaType.TV,
+            modified_ts=modified.timestamp(),
+        )
+        assert media_file.modified_date == modified
+        parsed = json.loads(media_file.model_dump_json())
+        assert parsed["modified_date"] == modified.isoformat()
+        assert "modified_ts" not in parsed
+        # Saved plans store the ISO string; it must load back unchanged
+        reloaded = MediaFile.model_validate(parsed)
+        assert reloaded.modified_date == modified
+
 
 class TestRenamePlanItem:
     """Tests for the RenamePlanItem model."""
@@ -321,3 +339,4 @@ class TestScanResult:
         assert len(plan.items) == 0  # Initially empty
         assert plan.platform == "plex"
         assert plan.media_types == [MediaType.TV, MediaType.MOVIE]
+        assert plan.id == f"{plan.created_at:%Y%m%d_%H%M%S}_{os.getpid()}"
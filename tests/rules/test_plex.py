@@ -110,6 +110,26 @@ class TestPlexRuleSet:
         ).absolute()
         assert target == expected
 
+    def test_tv_show_path_with_underscores(self, rule_set: PlexRuleSet) -> None:
+        """Test that underscores and dots both normalize to single spaces.
+
+        Scenario:
+        - TV show file mixing underscores and dots as word separators.
+        """
+        media_file = MediaFile(
+            path=Path("/test/Breaking_Bad.S01E05.Gray_Matter.mp4").absolute(),
+            size=1024,
+            media_type=MediaType.TV,
+            modified_date=datetime.now(),
+        )
+
+        target = rule_set.target_path(media_file, Path("/media").absolute())
+
+        expected = Path(
+            "/media/TV Shows/Breaking Bad/Season 01/Breaking Bad - S01E05 - Gray Matter.mp4"
+        ).absolute()
+        assert target == expected
+
     def test_tv_show_path_no_episode_title(self, rule_set: PlexRuleSet) -> None:
         """Test target path generation for a TV show file without an episode title.
 
@@ -265,6 +285,34 @@ class TestPlexRuleSet:
         with pytest.raises(ValueError):
             rule_set.target_path(media_file, base_dir)
 
+    def test_target_paths_batch(self, rule_set: PlexRuleSet) -> None:
+        """Test batched target path generation.
+
+        Scenario:
+        - A supported movie and an unsupported music file are resolved together.
+        - Results keep input order; the unsupported file yields its ValueError
+          instead of aborting the batch.
+        """
+        movie = MediaFile(
+            path=Path("/test/The Matrix (1999).mp4").absolute(),
+            size=1024,
+            media_type=MediaType.MOVIE,
+            modified_date=datetime.now(),
+        )
+        song = MediaFile(
+            path=Path("/test/song.mp3").absolute(),
+            size=1024,
+            media_type=MediaType.MUSIC,
+            modified_date=datetime.now(),
+        )
+        base_dir = Path("/media").absolute()
+
+        results = rule_set.target_paths_batch([movie, song], base_dir)
+
+        assert [media_file for media_file, _ in results] == [movie, song]
+        assert results[0][1] == rule_set.target_path(movie, base_dir)
+        assert isinstance(results[1][1], ValueError)
+
     def test_movie_path_with_metadata_year(self, rule_set: PlexRuleSet) -> None:
         """Test movie path generation uses year from MediaMetadata if provided.
 
@@ -334,6 +382,51 @@ class TestPlexRuleSet:
         ).absolute()
         assert target == expected
 
+    def test_tv_show_path_follows_metadata_edits_and_episode_index(
+        self, rule_set: PlexRuleSet
+    ) -> None:
+        """Test episode titles track metadata edits unless an index is passed.
+
+        Scenario:
+        - The same MediaMetadata names a file, then gains a titled episode.
+        - Without an index the new episode is found; a prebuilt index is used
+          as given.
+        """
+        from namegnome.metadata.models import (
+            MediaMetadata,
+            MediaMetadataType,
+            TVEpisode,
+        )
+        from namegnome.rules.plex import index_episodes
+
+        media_file = MediaFile(
+            path=Path("/test/Breaking Bad S01E05.mp4").absolute(),
+            size=1024,
+            media_type=MediaType.TV,
+            modified_date=datetime.now(),
+        )
+        base_dir = Path("/media").absolute()
+        metadata = MediaMetadata(
+            title="Breaking Bad",
+            media_type=MediaMetadataType.TV_SHOW,
+            provider="tvdb",
+            provider_id="bbad",
+            episodes=[TVEpisode(title="Pilot", episode_number=1, season_number=1)],
+        )
+        index = index_episodes(metadata)
+        first = rule_set.target_path(media_file, base_dir, metadata=metadata)
+        assert first.name == "Breaking Bad - S01E05 - Unknown Episode.mp4"
+
+        metadata.episodes.append(
+            TVEpisode(title="Gray Matter", episode_number=5, season_number=1)
+        )
+        edited = rule_set.target_path(media_file, base_dir, metadata=metadata)
+        assert edited.name == "Breaking Bad - S01E05 - Gray Matter.mp4"
+        indexed = rule_set.target_path(
+            media_file, base_dir, metadata=metadata, episode_index=index
+        )
+        assert indexed.name == "Breaking Bad - S01E05 - Unknown Episode.mp4"
+
     def test_movie_path_metadata_missing_year_fallback(
         self, rule_set: PlexRuleSet
     ) -> None: